@@ -79,6 +79,37 @@ class AnalysisSection:
                 )
             )
 
+        # gauss point coordinates and weights (weight * jacobian) for 3 point gaussian
+        # integration of all elements, used for vectorised section analyses
+        self.gp_x, self.gp_y, self.gp_weights = self.calculate_gauss_points()
+
+    def calculate_gauss_points(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculates the gauss points of all elements in the analysis section.
+
+        Returns:
+            Global ``x`` and ``y`` coordinates and integration weights (gaussian weight
+            multiplied by the jacobian determinant) of 3 point gaussian integration for
+            every element
+        """
+        gps = np.array(utils.gauss_points(n=3))
+        n_shape = np.column_stack((1 - gps[:, 1] - gps[:, 2], gps[:, 1], gps[:, 2]))
+
+        # element vertex coordinates, shape (n_elements, 3, 2)
+        nodes = self.mesh_nodes[
+            np.asarray(self.mesh_elements, dtype=int).reshape(-1, 3)
+        ]
+
+        # gauss point coordinates, shape (n_elements, 3, 2)
+        gp_coords = np.einsum("gk,ekd->egd", n_shape, nodes)
+
+        # jacobian determinant is constant over a linear triangle
+        j = (nodes[:, 1, 0] - nodes[:, 0, 0]) * (nodes[:, 2, 1] - nodes[:, 0, 1]) - (
+            nodes[:, 2, 0] - nodes[:, 0, 0]
+        ) * (nodes[:, 1, 1] - nodes[:, 0, 1])
+        weights = np.outer(j, gps[:, 0])
+
+        return gp_coords[:, :, 0].ravel(), gp_coords[:, :, 1].ravel(), weights.ravel()
+
     def calculate_meshed_area(self) -> float:
         """Calculates the area of the analysis section based on the generated mesh.
 
@@ -92,6 +123,20 @@ class AnalysisSection:
 
         return area
 
+    def second_moments_of_area(self) -> tuple[float, float, float]:
+        """Calculates the second moments of area of the analysis section.
+
+        Returns:
+            Modulus weighted second moments of area (``e_ixx``, ``e_iyy``, ``e_ixy``)
+        """
+        e_w = self.material.elastic_modulus * self.gp_weights
+
+        return (
+            float(np.dot(e_w, self.gp_y * self.gp_y)),
+            float(np.dot(e_w, self.gp_x * self.gp_x)),
+            float(np.dot(e_w, self.gp_x * self.gp_y)),
+        )
+
     def get_elastic_stress(
         self,
         n: float,
@@ -195,33 +240,28 @@ class AnalysisSection:
         Returns:
             Axial force, section moments and min/max strain
         """
-        # initialise section actions
-        n_sec = 0
-        m_x_sec = 0
-        m_y_sec = 0
-        min_strain = 0
-        max_strain = 0
+        # get strains at all gauss points
+        strains = utils.get_service_strain(
+            point=(self.gp_x, self.gp_y),
+            ecf=ecf,
+            eps0=eps0,
+            theta=theta,
+            kappa=kappa,
+        )
 
-        for el in self.elements:
-            (
-                el_n,
-                el_m_x,
-                el_m_y,
-                el_min_strain,
-                el_max_strain,
-            ) = el.calculate_service_actions(
-                ecf=ecf,
-                eps0=eps0,
-                theta=theta,
-                kappa=kappa,
-                centroid=centroid,
-            )
-            min_strain = min(min_strain, el_min_strain)
-            max_strain = max(max_strain, el_max_strain)
+        if len(strains) == 0:
+            return 0, 0, 0, 0, 0
 
-            n_sec += el_n
-            m_x_sec += el_m_x
-            m_y_sec += el_m_y
+        # get stresses at all gauss points and calculate forces (stress * area)
+        stresses = self.material.stress_strain_profile.get_stress(strain=strains)
+        forces = self.gp_weights * stresses
+
+        # calculate section actions
+        n_sec = float(forces.sum())
+        m_x_sec = float(np.dot(forces, self.gp_y - centroid[1]))
+        m_y_sec = float(np.dot(forces, self.gp_x - centroid[0]))
+        min_strain = min(float(strains.min()), 0)
+        max_strain = max(float(strains.max()), 0)
 
         return n_sec, m_x_sec, m_y_sec, min_strain, max_strain
 
@@ -307,23 +347,34 @@ class AnalysisSection:
         Returns:
             Axial force and resultant moments about the global axes
         """
-        # initialise section actions
-        n_sec = 0
-        m_x_sec = 0
-        m_y_sec = 0
+        if len(self.gp_weights) == 0:
+            return 0, 0, 0
 
-        for el in self.elements:
-            el_n, el_m_x, el_m_y = el.calculate_ultimate_actions(
+        # get strains at all gauss points
+        if isinf(d_n):
+            strains = np.full_like(self.gp_weights, ultimate_strain)
+        else:
+            strains = utils.get_ultimate_strain(
+                point=(self.gp_x, self.gp_y),
                 point_na=point_na,
                 d_n=d_n,
                 theta=theta,
                 ultimate_strain=ultimate_strain,
-                centroid=centroid,
             )
 
-            n_sec += el_n
-            m_x_sec += el_m_x
-            m_y_sec += el_m_y
+        # get stresses at all gauss points
+        if isinstance(self.material, Concrete):
+            profile = self.material.ultimate_stress_strain_profile
+        else:
+            profile = self.material.stress_strain_profile
+
+        stresses = profile.get_stress(strain=strains)
+
+        # calculate force (stress * area) and section actions
+        forces = self.gp_weights * stresses
+        n_sec = float(forces.sum())
+        m_x_sec = float(np.dot(forces, self.gp_y - centroid[1]))
+        m_y_sec = float(np.dot(forces, self.gp_x - centroid[0]))
 
         return n_sec, m_x_sec, m_y_sec
 
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from math import inf, isinf
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import matplotlib.patches as mpatches
 import numpy as np
 import sectionproperties.pre.geometry as sp_geom
 from rich.live import Live
-from scipy.optimize import brentq
+from scipy.optimize import brentq, newton
 
 import concreteproperties.results as res
+import concreteproperties.stress_strain_profile as ssp
 import concreteproperties.utils as utils
 from concreteproperties.analysis_section import AnalysisSection
 from concreteproperties.material import Concrete, SteelStrand
@@ -23,6 +28,47 @@ from concreteproperties.pre import CPGeom, CPGeomConcrete
 if TYPE_CHECKING:
     import matplotlib.axes
 
+# maximum number of meshed analysis sections cached by a ConcreteSection
+_ANALYSIS_SECTION_CACHE_SIZE = 256
+
+
+@dataclass
+class _ThetaContext:
+    """Geometric quantities that depend only on the neutral axis angle.
+
+    Args:
+        extreme_fibre: Global coordinate of the extreme compression fibre
+        d_t: Neutral axis depth at the extreme tensile fibre
+        ef_v: Local ``v`` coordinate of the extreme compression fibre
+        lumped_v: Local ``v`` coordinates of the centroids of the lumped geometries
+    """
+
+    extreme_fibre: tuple[float, float]
+    d_t: float
+    ef_v: float
+    lumped_v: np.ndarray
+
+
+@dataclass
+class _LumpedContext:
+    """Material dependent quantities of the lumped geometries.
+
+    Args:
+        materials: Material of each lumped geometry, held so that the identities in
+            ``key`` remain valid
+        key: Identities of the material and stress-strain profile of each lumped
+            geometry
+        prestress_strains: Initial prestress strain of each lumped geometry, ``None``
+            if there are no strands
+        groups: Stress-strain profiles and the indices of the lumped geometries that
+            use each profile
+    """
+
+    materials: tuple
+    key: tuple[tuple[int, ...], tuple[int, ...]]
+    prestress_strains: np.ndarray | None
+    groups: list[tuple[ssp.StressStrainProfile, np.ndarray]]
+
 
 class ConcreteSection:
     """Class for a reinforced concrete section."""
@@ -94,6 +140,31 @@ class ConcreteSection:
 
             self.all_geometries.append(cp_geom)
 
+        # areas and centroids of the lumped geometries, used in vectorised analyses
+        self._lumped_geoms = self.reinf_geometries_lumped + self.strand_geometries
+        self._lumped_areas = np.array(
+            [geom.calculate_area() for geom in self._lumped_geoms], dtype=float
+        )
+        self._lumped_centroids = np.array(
+            [geom.calculate_centroid() for geom in self._lumped_geoms], dtype=float
+        ).reshape(-1, 2)
+
+        # material dependent quantities of the lumped geometries
+        self._lumped_context: _LumpedContext | None = None
+
+        # cache of unique strains in the stress-strain profiles, keyed by profile id
+        self._unique_strains_cache: dict[
+            int, tuple[ssp.StressStrainProfile, np.ndarray]
+        ] = {}
+
+        # cache of neutral axis angle dependent quantities, keyed by neutral axis angle
+        self._theta_cache: dict[float, _ThetaContext] = {}
+
+        # least recently used cache of meshed analysis sections, keyed by geometry
+        self._analysis_section_cache: OrderedDict[
+            tuple[bytes, int], AnalysisSection
+        ] = OrderedDict()
+
         # calculate gross properties
         self.gross_properties = res.GrossProperties()
         self.calculate_gross_area_properties()
@@ -111,37 +182,73 @@ class ConcreteSection:
         if geometric_centroid_override:
             self.moment_centroid = self.gross_properties.cx, self.gross_properties.cy
 
-    def calculate_gross_area_properties(self) -> None:
-        """Calculates and stores gross section area properties."""
-        # loop through all geometries
-        for geom in self.all_geometries:
-            # area and centroid of geometry
-            area = geom.calculate_area()
-            centroid = geom.calculate_centroid()
+    def __getstate__(self) -> dict:
+        """Returns the state of the section for pickling and copying.
 
-            self.gross_properties.total_area += area
-            self.gross_properties.e_a += area * geom.material.elastic_modulus
-            self.gross_properties.mass += area * geom.material.density
-            self.gross_properties.e_qx += (
-                area * geom.material.elastic_modulus * centroid[1]
-            )
-            self.gross_properties.e_qy += (
-                area * geom.material.elastic_modulus * centroid[0]
-            )
-            self.gross_properties.qx_gross += area * centroid[1]
-            self.gross_properties.qy_gross += area * centroid[0]
+        The unique strain, lumped geometry and analysis section caches hold references
+        to materials and geometries that are checked by identity, which is not
+        preserved, so they are reset rather than copied. The neutral axis angle cache
+        depends only on the geometry and is kept.
 
-        # sum concrete areas
-        for conc_geom in self.concrete_geometries:
-            self.gross_properties.concrete_area += conc_geom.calculate_area()
+        Returns:
+            Section state
+        """
+        state = self.__dict__.copy()
+        state["_unique_strains_cache"] = {}
+        state["_lumped_context"] = None
+        state["_analysis_section_cache"] = OrderedDict()
 
-        # sum reinforcement meshed areas
-        for meshed_geom in self.reinf_geometries_meshed:
-            self.gross_properties.reinf_meshed_area += meshed_geom.calculate_area()
+        return state
 
-        # sum reinforcement lumped areas
-        for lumped_geom in self.reinf_geometries_lumped:
-            self.gross_properties.reinf_lumped_area += lumped_geom.calculate_area()
+    def calculate_gross_area_properties(self) -> None:
+        """Calculates and stores gross section area properties."""
+        areas = []
+        centroids = []
+        elastic_moduli = []
+        densities = []
+        lumped = []
+
+        # loop through all geometries once
+        for geom in self.all_geometries:
+            # area, centroid and material properties of geometry
+            area = geom.calculate_area()
+            areas.append(area)
+            centroids.append(geom.calculate_centroid())
+            elastic_moduli.append(geom.material.elastic_modulus)
+            densities.append(geom.material.density)
+            lumped.append(not geom.material.meshed)
+
+            # sum concrete, reinforcement meshed and reinforcement lumped areas
+            if isinstance(geom, CPGeomConcrete):
+                self.gross_properties.concrete_area += area
+            elif geom.material.meshed:
+                self.gross_properties.reinf_meshed_area += area
+            elif not isinstance(geom.material, SteelStrand):
+                self.gross_properties.reinf_lumped_area += area
+
+            # global second moments of area of meshed geometries
+            if geom.material.meshed:
+                sec = self._get_analysis_section(geom=geom)
+                e_ixx_g, e_iyy_g, e_ixy_g = sec.second_moments_of_area()
+                self.gross_properties.e_ixx_g += e_ixx_g
+                self.gross_properties.e_iyy_g += e_iyy_g
+                self.gross_properties.e_ixy_g += e_ixy_g
+
+        # total area, mass and first moments of area
+        areas = np.array(areas)
+        centroids = np.array(centroids, dtype=float).reshape(-1, 2)
+        elastic_moduli = np.array(elastic_moduli, dtype=float)
+        densities = np.array(densities, dtype=float)
+        lumped = np.array(lumped, dtype=bool)
+        e_areas = areas * elastic_moduli
+
+        self.gross_properties.total_area = float(areas.sum())
+        self.gross_properties.e_a = float(e_areas.sum())
+        self.gross_properties.mass = float(np.dot(areas, densities))
+        self.gross_properties.e_qx = float(np.dot(e_areas, centroids[:, 1]))
+        self.gross_properties.e_qy = float(np.dot(e_areas, centroids[:, 0]))
+        self.gross_properties.qx_gross = float(np.dot(areas, centroids[:, 1]))
+        self.gross_properties.qy_gross = float(np.dot(areas, centroids[:, 0]))
 
         # perimeter
         self.gross_properties.perimeter = self.compound_geometry.calculate_perimeter()
@@ -160,33 +267,22 @@ class ConcreteSection:
             self.gross_properties.qx_gross / self.gross_properties.total_area
         )
 
-        # global second moments of area
-        # meshed geometries
-        for geom in self.meshed_geometries:
-            sec = AnalysisSection(geometry=geom)
-
-            for el in sec.elements:
-                el_e_ixx_g, el_e_iyy_g, el_e_ixy_g = el.second_moments_of_area()
-                self.gross_properties.e_ixx_g += el_e_ixx_g
-                self.gross_properties.e_iyy_g += el_e_iyy_g
-                self.gross_properties.e_ixy_g += el_e_ixy_g
-
-        # lumped geometries - treat as lumped circles
-        for geom in self.reinf_geometries_lumped + self.strand_geometries:
-            # area, diameter and centroid of geometry
-            area = geom.calculate_area()
-            diam = np.sqrt(4 * area / np.pi)
-            centroid = geom.calculate_centroid()
+        # global second moments of area of lumped geometries - treat as lumped circles
+        lumped_moduli = elastic_moduli[lumped]
+        lumped_areas = areas[lumped]
+        x = centroids[lumped, 0]
+        y = centroids[lumped, 1]
+        i_circ = lumped_areas**2 / (4 * np.pi)  # pi * d^4 / 64 with d^2 = 4 * A / pi
 
-            self.gross_properties.e_ixx_g += geom.material.elastic_modulus * (
-                np.pi * pow(diam, 4) / 64 + area * centroid[1] * centroid[1]
-            )
-            self.gross_properties.e_iyy_g += geom.material.elastic_modulus * (
-                np.pi * pow(diam, 4) / 64 + area * centroid[0] * centroid[0]
-            )
-            self.gross_properties.e_ixy_g += geom.material.elastic_modulus * (
-                area * centroid[0] * centroid[1]
-            )
+        self.gross_properties.e_ixx_g += float(
+            np.dot(lumped_moduli, i_circ + lumped_areas * y * y)
+        )
+        self.gross_properties.e_iyy_g += float(
+            np.dot(lumped_moduli, i_circ + lumped_areas * x * x)
+        )
+        self.gross_properties.e_ixy_g += float(
+            np.dot(lumped_moduli, lumped_areas * x * y)
+        )
 
         # centroidal second moments of area
         self.gross_properties.e_ixx_c = (
@@ -297,6 +393,177 @@ class ConcreteSection:
             concrete_properties=self.gross_properties, elastic_modulus=elastic_modulus
         )
 
+    def _get_theta_context(
+        self,
+        theta: float,
+    ) -> _ThetaContext:
+        r"""Returns the geometric quantities that depend on the neutral axis angle.
+
+        The section geometry does not change, so these are calculated once for each
+        ``theta`` rather than on every solver iteration.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Returns:
+            Neutral axis angle context
+        """
+        try:
+            return self._theta_cache[theta]
+        except KeyError:
+            extreme_fibre, d_t = utils.calculate_extreme_fibre(
+                points=self.compound_geometry.points, theta=theta
+            )
+            _, ef_v = utils.global_to_local(
+                theta=theta, x=extreme_fibre[0], y=extreme_fibre[1]
+            )
+            _, lumped_v = utils.global_to_local(
+                theta=theta,
+                x=self._lumped_centroids[:, 0],
+                y=self._lumped_centroids[:, 1],
+            )
+
+            ctx = _ThetaContext(
+                extreme_fibre=extreme_fibre, d_t=d_t, ef_v=ef_v, lumped_v=lumped_v
+            )
+            self._theta_cache[theta] = ctx
+
+            return ctx
+
+    def _get_extreme_fibre(
+        self,
+        theta: float,
+    ) -> tuple[tuple[float, float], float]:
+        r"""Returns the extreme fibre location of the section.
+
+        Args:
+            theta: Angle (in radians) the neutral axis makes with the horizontal axis
+                (:math:`-\pi \leq \theta \leq \pi`)
+
+        Returns:
+            Global coordinate of the extreme compression fibre (``x``, ``y``) and the
+            neutral axis depth at the extreme tensile fibre
+        """
+        ctx = self._get_theta_context(theta=theta)
+
+        return ctx.extreme_fibre, ctx.d_t
+
+    def _get_analysis_section(
+        self,
+        geom: CPGeom | CPGeomConcrete,
+    ) -> AnalysisSection:
+        """Returns a meshed analysis section for a geometry.
+
+        Meshing is expensive and the same geometry is often meshed repeatedly, e.g.
+        when a neutral axis lies outside a geometry. Analysis sections are therefore
+        cached by the geometry's shape and material, discarding the least recently
+        used once the cache is full.
+
+        Args:
+            geom: Geometry to mesh
+
+        Returns:
+            Analysis section
+        """
+        key = (geom.geom.wkb, id(geom.material))
+        sec = self._analysis_section_cache.get(key)
+
+        # check identity in case the section has been copied
+        if sec is not None and sec.material is geom.material:
+            self._analysis_section_cache.move_to_end(key)
+
+            return sec
+
+        sec = AnalysisSection(geometry=geom)
+        self._analysis_section_cache[key] = sec
+
+        if len(self._analysis_section_cache) > _ANALYSIS_SECTION_CACHE_SIZE:
+            self._analysis_section_cache.popitem(last=False)
+
+        return sec
+
+    def _get_unique_strains(
+        self,
+        geom: CPGeom | CPGeomConcrete,
+        ultimate: bool,
+    ) -> np.ndarray:
+        """Returns the unique strains in the stress-strain profile of a geometry.
+
+        Results are cached for each stress-strain profile object, so that materials
+        reassigned after the section is created (e.g. by a design code) are respected.
+
+        Args:
+            geom: Geometry from which to extract the strains
+            ultimate: If set to True, uses the ultimate stress-strain profile for
+                concrete geometries
+
+        Returns:
+            Ordered (read-only) array of unique strains
+        """
+        if ultimate and isinstance(geom, CPGeomConcrete):
+            profile = geom.material.ultimate_stress_strain_profile
+        else:
+            profile = geom.material.stress_strain_profile
+
+        cached = self._unique_strains_cache.get(id(profile))
+
+        # the cache holds a reference to the profile, check identity in case the
+        # section has been copied
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+
+        strains = np.array(profile.get_unique_strains(), dtype=float)
+        strains.flags.writeable = False
+        self._unique_strains_cache[id(profile)] = profile, strains
+
+        return strains
+
+    def _get_lumped_context(self) -> _LumpedContext:
+        """Returns the material dependent quantities of the lumped geometries.
+
+        The context is rebuilt whenever the identity of a material or stress-strain
+        profile changes, so that materials reassigned after the section is created
+        (e.g. by a design code) are respected.
+
+        Returns:
+            Lumped geometry context
+        """
+        materials = tuple(map(attrgetter("material"), self._lumped_geoms))
+        key = (
+            tuple(map(id, materials)),
+            tuple(map(id, map(attrgetter("stress_strain_profile"), materials))),
+        )
+        ctx = self._lumped_context
+
+        # the context holds references to the materials, so their ids are not reused
+        if ctx is not None and ctx.key == key:
+            return ctx
+
+        # initial prestress strains (N.B. ignore eps_ce)
+        prestress_strains = None
+
+        if self.strand_geometries:
+            prestress_strains = np.zeros(len(materials))
+
+            for idx, material in enumerate(materials):
+                if isinstance(material, SteelStrand):
+                    prestress_strains[idx] = material.get_prestress_strain()
+
+        groups = [
+            (profile, np.array(idxs, dtype=int))
+            for profile, idxs in utils.group_by_profile(geoms=self._lumped_geoms)
+        ]
+
+        self._lumped_context = _LumpedContext(
+            materials=materials,
+            key=key,
+            prestress_strains=prestress_strains,
+            groups=groups,
+        )
+
+        return self._lumped_context
+
     def calculate_cracked_properties(
         self,
         theta: float = 0,
@@ -318,9 +585,7 @@ class ConcreteSection:
 
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = self._get_extreme_fibre(theta=theta)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = d_t  # neutral axis at extreme tensile fibre
 
@@ -421,9 +686,7 @@ class ConcreteSection:
             Cracked neutral axis convergence
         """
         # calculate extreme fibre in global coordinates
-        extreme_fibre, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=cracked_results.theta
-        )
+        extreme_fibre, d_t = self._get_extreme_fibre(theta=cracked_results.theta)
 
         # validate d_nc input
         if d_nc <= 0:
@@ -512,13 +775,11 @@ class ConcreteSection:
         for geom in cracked_results.cracked_geometries:
             # if meshed
             if geom.material.meshed:
-                sec = AnalysisSection(geometry=geom)
-
-                for el in sec.elements:
-                    el_e_ixx_g, el_e_iyy_g, el_e_ixy_g = el.second_moments_of_area()
-                    cracked_results.e_ixx_g_cr += el_e_ixx_g
-                    cracked_results.e_iyy_g_cr += el_e_iyy_g
-                    cracked_results.e_ixy_g_cr += el_e_ixy_g
+                sec = self._get_analysis_section(geom=geom)
+                e_ixx_g, e_iyy_g, e_ixy_g = sec.second_moments_of_area()
+                cracked_results.e_ixx_g_cr += e_ixx_g
+                cracked_results.e_iyy_g_cr += e_iyy_g
+                cracked_results.e_ixy_g_cr += e_ixy_g
             # if lumped
             else:
                 # area, diameter and centroid of geometry
@@ -724,7 +985,7 @@ class ConcreteSection:
             moment_curvature.convergence.append(moment_curvature._failure_convergence)
 
         # create progress bar
-        if progress_bar:
+        if utils.show_progress(progress_bar=progress_bar):
             # create progress bar
             progress = utils.create_unknown_progress()
 
@@ -769,9 +1030,7 @@ class ConcreteSection:
         moment_curvature._failure = False
 
         # get global coordinates of extreme compressive fibre
-        ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=moment_curvature.theta
-        )
+        ecf, _ = self._get_extreme_fibre(theta=moment_curvature.theta)
 
         # create splits in meshed geometries at points in stress-strain profiles
         meshed_split_geoms: list[CPGeom | CPGeomConcrete] = []
@@ -783,6 +1042,7 @@ class ConcreteSection:
                 ecf=ecf,
                 eps0=eps0,
                 kappa=kappa,
+                strains=self._get_unique_strains(geom=meshed_geom, ultimate=False),
             )
 
             meshed_split_geoms.extend(split_geoms)
@@ -795,7 +1055,7 @@ class ConcreteSection:
 
         # calculate meshed geometry actions
         for meshed_geom in meshed_split_geoms:
-            sec = AnalysisSection(geometry=meshed_geom)
+            sec = self._get_analysis_section(geom=meshed_geom)
 
             n_sec, m_x_sec, m_y_sec, min_strain, max_strain = sec.service_analysis(
                 ecf=ecf,
@@ -891,6 +1151,7 @@ class ConcreteSection:
         self,
         theta: float = 0,
         n: float = 0,
+        d_n_guess: float | None = None,
     ) -> res.UltimateBendingResults:
         r"""Calculates ultiamte bending capacity.
 
@@ -912,6 +1173,12 @@ class ConcreteSection:
             theta: Angle (in radians) the neutral axis makes with the horizontal axis
                 (:math:`-\pi \leq \theta \leq \pi`)
             n: Net axial force (nominal axial load)
+            d_n_guess: Initial estimate of the neutral axis depth, e.g. from an
+                analysis at a similar axial force or neutral axis angle. If provided,
+                a secant iteration is started from this estimate, which typically
+                requires far fewer section analyses than the bracketed solver. Falls
+                back to the bracketed solver if the iteration does not converge
+                within the neutral axis depth limits.
 
         Raises:
             AnalysisError: If the analysis fails
@@ -921,22 +1188,71 @@ class ConcreteSection:
         """
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = self._get_extreme_fibre(theta=theta)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = 6 * d_t  # neutral axis at sufficiently large tensile fibre
 
         # initialise ultimate bending results
         ultimate_results = res.UltimateBendingResults(theta=theta)
 
+        # trial neutral axis depths and axial force residuals
+        trials: list[tuple[float, float]] = []
+
+        # axial force convergence, section actions of the most recent evaluation are
+        # stored in ultimate_results
+        def convergence(d_n: float) -> float:
+            residual = (
+                n
+                - self.calculate_ultimate_section_actions(
+                    d_n=d_n, ultimate_results=ultimate_results
+                ).n
+            )
+            trials.append((d_n, residual))
+
+            return residual
+
+        # attempt secant iteration from the initial estimate
+        if d_n_guess is not None and a < d_n_guess < b:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+
+                    (d_n, r) = newton(
+                        func=convergence,
+                        x0=d_n_guess,
+                        tol=1e-3,
+                        rtol=1e-6,
+                        maxiter=20,
+                        full_output=True,
+                        disp=False,
+                    )
+            except ValueError:
+                # trial neutral axis depth was not positive
+                r = None
+
+            # the secant method converges on step size, so also check the axial force
+            # residual, allowing the force equivalent of the neutral axis tolerance
+            if r is not None and r.converged and a <= d_n <= b and len(trials) > 1:
+                (d_n_0, res_0), (d_n_1, res_1) = trials[-2:]
+
+                if d_n_1 != d_n_0:
+                    slope = abs((res_1 - res_0) / (d_n_1 - d_n_0))
+                    n_tol = slope * (1e-3 + 1e-6 * d_n)
+
+                    # the last iteration is not evaluated at the root, store results
+                    self.calculate_ultimate_section_actions(
+                        d_n=d_n, ultimate_results=ultimate_results
+                    )
+
+                    if abs(n - ultimate_results.n) <= n_tol:
+                        return ultimate_results
+
         # find neutral axis that gives convergence of the axial force
         try:
             (d_n, r) = brentq(
-                f=self.ultimate_normal_force_convergence,
+                f=convergence,
                 a=a,
                 b=b,
-                args=(n, ultimate_results),
                 xtol=1e-3,
                 rtol=1e-6,
                 full_output=True,
@@ -1002,17 +1318,9 @@ class ConcreteSection:
         if ultimate_results is None:
             ultimate_results = res.UltimateBendingResults(theta=0)
 
-        # calculate extreme fibre in global coordinates
-        extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
-        )
-
-        # extreme fibre in local coordinates
-        _, ef_v = utils.global_to_local(
-            theta=ultimate_results.theta,
-            x=extreme_fibre[0],
-            y=extreme_fibre[1],
-        )
+        # get extreme fibre in global and local coordinates
+        ctx = self._get_theta_context(theta=ultimate_results.theta)
+        extreme_fibre = ctx.extreme_fibre
 
         # validate d_n input
         if d_n <= 0:
@@ -1039,6 +1347,7 @@ class ConcreteSection:
                     point_na=point_na,
                     ultimate_strain=self.gross_properties.conc_ultimate_strain,
                     d_n=d_n,
+                    strains=self._get_unique_strains(geom=meshed_geom, ultimate=True),
                 )
 
                 meshed_split_geoms.extend(split_geoms)
@@ -1047,11 +1356,10 @@ class ConcreteSection:
         n = 0
         m_x = 0
         m_y = 0
-        k_u = []
 
         # calculate meshed geometry actions
         for meshed_geom in meshed_split_geoms:
-            sec = AnalysisSection(geometry=meshed_geom)
+            sec = self._get_analysis_section(geom=meshed_geom)
             n_sec, m_x_sec, m_y_sec = sec.ultimate_analysis(
                 point_na=point_na,
                 d_n=d_n,
@@ -1064,48 +1372,44 @@ class ConcreteSection:
             m_x += m_x_sec
             m_y += m_y_sec
 
-        # calculate lumped actions
-        for lumped_geom in self.reinf_geometries_lumped + self.strand_geometries:
-            # calculate area and centroid
-            area = lumped_geom.calculate_area()
-            centroid = lumped_geom.calculate_centroid()
+        # calculate lumped actions (vectorised over all lumped geometries)
+        if self._lumped_geoms:
+            lumped = self._get_lumped_context()
+            x = self._lumped_centroids[:, 0]
+            y = self._lumped_centroids[:, 1]
 
-            # get strain at centroid of lump
+            # get strain at centroid of lumps, the neutral axis lies d_n below the
+            # extreme fibre in local coordinates
             if isinf(d_n):
-                strain = self.gross_properties.conc_ultimate_strain
+                strains = np.full(
+                    len(self._lumped_geoms), self.gross_properties.conc_ultimate_strain
+                )
             else:
-                strain = utils.get_ultimate_strain(
-                    point=(centroid[0], centroid[1]),
-                    point_na=point_na,
-                    d_n=d_n,
-                    theta=ultimate_results.theta,
-                    ultimate_strain=self.gross_properties.conc_ultimate_strain,
+                strains = (
+                    (ctx.lumped_v - (ctx.ef_v - d_n))
+                    / d_n
+                    * self.gross_properties.conc_ultimate_strain
                 )
 
-                # add initial prestress strain (N.B. ignore eps_ce)
-                if isinstance(lumped_geom.material, SteelStrand):
-                    eps_pe = -lumped_geom.material.get_prestress_strain()
-                    strain += eps_pe
+                # add initial prestress strain
+                if lumped.prestress_strains is not None:
+                    strains -= lumped.prestress_strains
 
-            # calculate stress and force
-            stress = lumped_geom.material.stress_strain_profile.get_stress(
-                strain=strain
-            )
-            force = stress * area
-            n += force
+            # calculate stresses and forces, evaluating each stress-strain profile once
+            stresses = np.zeros(len(self._lumped_geoms))
 
-            # convert centroid to local coordinates
-            _, c_v = utils.global_to_local(
-                theta=ultimate_results.theta, x=centroid[0], y=centroid[1]
-            )
+            for profile, idxs in lumped.groups:
+                stresses[idxs] = profile.get_stress(strain=strains[idxs])
 
-            # calculate moment
-            m_x += force * (centroid[1] - self.moment_centroid[1])
-            m_y += force * (centroid[0] - self.moment_centroid[0])
+            forces = stresses * self._lumped_areas
+            n += forces.sum()
+
+            # calculate moments
+            m_x += np.dot(forces, y - self.moment_centroid[1])
+            m_y += np.dot(forces, x - self.moment_centroid[0])
 
             # calculate k_u
-            d = ef_v - c_v
-            k_u.append(d_n / d)
+            ultimate_results.k_u = float(np.min(d_n / (ctx.ef_v - ctx.lumped_v)))
 
         # calculate resultant moment
         m_xy = np.sqrt(m_x * m_x + m_y * m_y)
@@ -1117,9 +1421,6 @@ class ConcreteSection:
         ultimate_results.m_y = m_y
         ultimate_results.m_xy = m_xy
 
-        if k_u:
-            ultimate_results.k_u = min(k_u)
-
         return ultimate_results
 
     def moment_interaction_diagram(
@@ -1133,6 +1434,7 @@ class ConcreteSection:
         max_comp: float | None = None,
         max_comp_labels: list[str] | None = None,
         progress_bar: bool = True,
+        n_jobs: int = 1,
     ) -> res.MomentInteractionResults:
         r"""Generates a moment interaction diagram given a neutral axis angle ``theta``.
 
@@ -1183,11 +1485,18 @@ class ConcreteSection:
                 first value is at zero moment, second value is at the intersection with
                 the interaction diagram
             progress_bar: If set to True, displays the progress bar
+            n_jobs: Number of processes used to analyse the points on the moment
+                interaction diagram. If set to ``-1``, uses all available processors.
+                Parallel analyses do not use the previous point as an initial guess
+                when ``n_spacing`` is provided. On platforms that spawn new processes
+                (e.g. Windows), the calling script must be guarded by
+                ``if __name__ == "__main__":``.
 
         Raises:
             ValueError: Length of ``limits`` must equal 2
             ValueError: Length of ``labels`` must be 1 or 2 + number of control points
             ValueError: If ``max_comp`` is greater than the maximum axial capacity
+            ValueError: If ``n_jobs`` is not a positive integer or -1
 
         Returns:
             Moment interaction results object
@@ -1198,10 +1507,18 @@ class ConcreteSection:
         if control_points is None:
             control_points = [("kappa0", 0.0), ("fy", 1.0), ("N", 0.0)]
 
+        # validate number of processes
+        if (
+            not isinstance(n_jobs, int)
+            or isinstance(n_jobs, bool)
+            or n_jobs == 0
+            or n_jobs < -1
+        ):
+            msg = f"n_jobs must be a positive integer or -1, not {n_jobs}."
+            raise ValueError(msg)
+
         # compute extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        _, d_t = self._get_extreme_fibre(theta=theta)
 
         # validate limits length
         if len(limits) != 2:
@@ -1267,71 +1584,81 @@ class ConcreteSection:
                 start=start, stop=stop, num=n_points, dtype=float
             ).tolist()
 
-        # function that performs moment interaction analysis
-        def micurve(progress=None):
-            # loop through all analysis points
-            for idx, analysis_point in enumerate(analysis_list):
-                # calculate ultimate results:
-                # if we have axial forces
-                if n_spacing:
-                    # limits should be calculated based on neutral axis values
-                    if idx == 0:
-                        ult_res = self.calculate_ultimate_section_actions(
-                            d_n=limits_dn[0],
-                            ultimate_results=res.UltimateBendingResults(theta=theta),
-                        )
-                    elif idx == len(analysis_list) - 1:
-                        ult_res = self.calculate_ultimate_section_actions(
-                            d_n=limits_dn[1],
-                            ultimate_results=res.UltimateBendingResults(theta=theta),
-                        )
-                    else:
-                        ult_res = self.ultimate_bending_capacity(
-                            theta=theta, n=analysis_point
-                        )
-                # if we have neutral axes
-                else:
-                    ult_res = self.calculate_ultimate_section_actions(
-                        d_n=analysis_point,
-                        ultimate_results=res.UltimateBendingResults(theta=theta),
-                    )
+        # generate list of analyses, limits and control points are calculated based
+        # on neutral axis depths, other points are either neutral axis depths or
+        # axial forces
+        tasks: list[tuple[str, float, float]] = []
+
+        for idx, analysis_point in enumerate(analysis_list):
+            if not n_spacing:
+                tasks.append(("d_n", theta, analysis_point))
+            elif idx == 0:
+                tasks.append(("d_n", theta, limits_dn[0]))
+            elif idx == len(analysis_list) - 1:
+                tasks.append(("d_n", theta, limits_dn[1]))
+            else:
+                tasks.append(("n", theta, analysis_point))
 
-                # add labels for limits
-                if labels:
-                    if idx == 0:
-                        ult_res.label = labels[0]
-                    elif idx == len(analysis_list) - 1:
-                        ult_res.label = labels[1]
+        tasks.extend(("d_n", theta, d_n) for d_n in add_cp_dn)
 
-                # add ultimate result to moment interactions results
-                mi_results.results.append(ult_res)
+        # function that labels and stores the result of the analysis idx in tasks
+        def add_result(idx, ult_res, progress=None):
+            # add labels for limits and control points
+            if labels:
+                if idx == 0:
+                    ult_res.label = labels[0]
+                elif idx == len(analysis_list) - 1:
+                    ult_res.label = labels[1]
+                elif idx >= len(analysis_list):
+                    ult_res.label = labels[idx - len(analysis_list) + 2]
 
-                # update progress
-                if progress:
-                    progress.update(task, advance=1)
+            # add ultimate result to moment interactions results
+            mi_results.results.append(ult_res)
 
-            # add control points
-            for idx, d_n in enumerate(add_cp_dn):
-                ult_res = self.calculate_ultimate_section_actions(
-                    d_n=d_n,
-                    ultimate_results=res.UltimateBendingResults(theta=theta),
-                )
+            # update progress
+            if progress:
+                progress.update(task, advance=1)
+
+        # function that performs moment interaction analysis in parallel
+        def micurve_parallel(progress=None):
+            with ProcessPoolExecutor(
+                max_workers=None if n_jobs == -1 else n_jobs,
+                initializer=_init_mi_worker,
+                initargs=(self,),
+            ) as executor:
+                for idx, ult_res in enumerate(executor.map(_mi_worker, tasks)):
+                    add_result(idx=idx, ult_res=ult_res, progress=progress)
 
-                # add label
-                if labels:
-                    ult_res.label = labels[idx + 2]
+            # sort results
+            mi_results.sort_results()
 
-                # add ultimate result to moment interactions results
-                mi_results.results.append(ult_res)
+        # function that performs moment interaction analysis
+        def micurve(progress=None):
+            if n_jobs != 1:
+                micurve_parallel(progress=progress)
+                return
+
+            # loop through all analyses
+            for idx, (analysis_type, _, value) in enumerate(tasks):
+                if analysis_type == "n":
+                    # start from the neutral axis depth of the previous point
+                    ult_res = self.ultimate_bending_capacity(
+                        theta=theta,
+                        n=value,
+                        d_n_guess=mi_results.results[-1].d_n,
+                    )
+                else:
+                    ult_res = self.calculate_ultimate_section_actions(
+                        d_n=value,
+                        ultimate_results=res.UltimateBendingResults(theta=theta),
+                    )
 
-                # update progress
-                if progress:
-                    progress.update(task, advance=1)
+                add_result(idx=idx, ult_res=ult_res, progress=progress)
 
             # sort results
             mi_results.sort_results()
 
-        if progress_bar:
+        if utils.show_progress(progress_bar=progress_bar):
             # create progress bar
             progress = utils.create_known_progress()
 
@@ -1439,7 +1766,15 @@ class ConcreteSection:
         def bbcurve(progress=None):
             # loop through thetas
             for theta in theta_list:
-                ultimate_results = self.ultimate_bending_capacity(theta=theta, n=n)
+                # start from the neutral axis depth of the previous angle
+                if bb_results.results:
+                    d_n_guess = bb_results.results[-1].d_n
+                else:
+                    d_n_guess = None
+
+                ultimate_results = self.ultimate_bending_capacity(
+                    theta=theta, n=n, d_n_guess=d_n_guess
+                )
                 bb_results.results.append(ultimate_results)
 
                 if progress:
@@ -1448,7 +1783,7 @@ class ConcreteSection:
             # add first result to end of list top
             bb_results.results.append(bb_results.results[0])
 
-        if progress_bar:
+        if utils.show_progress(progress_bar=progress_bar):
             # create progress bar
             progress = utils.create_known_progress()
 
@@ -1808,9 +2143,7 @@ class ConcreteSection:
         lumped_reinf_forces = []
 
         # get global coordinates of extreme compressive fibre
-        ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        ecf, _ = self._get_extreme_fibre(theta=theta)
 
         # create splits in meshed geometries at points in stress-strain profiles
         meshed_split_geoms: list[CPGeom | CPGeomConcrete] = []
@@ -1905,9 +2238,7 @@ class ConcreteSection:
             Stress results object
         """
         # depth of neutral axis at extreme tensile fibre
-        extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
-        )
+        extreme_fibre, _ = self._get_extreme_fibre(theta=ultimate_results.theta)
 
         # find point on neutral axis by shifting by d_n
         if isinf(ultimate_results.d_n):
@@ -2038,9 +2369,7 @@ class ConcreteSection:
         d_ext = 0
 
         # calculate extreme fibre in local coordinates
-        extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=theta
-        )
+        extreme_fibre, _ = self._get_extreme_fibre(theta=theta)
         _, ef_v = utils.global_to_local(
             theta=theta, x=extreme_fibre[0], y=extreme_fibre[1]
         )
@@ -2211,3 +2540,38 @@ class ConcreteSection:
                 )
 
         return ax
+
+
+# section analysed by a moment interaction diagram worker process
+_mi_section: ConcreteSection | None = None
+
+
+def _init_mi_worker(section: ConcreteSection) -> None:
+    """Stores the section to be analysed in a worker process.
+
+    Args:
+        section: Concrete section
+    """
+    global _mi_section
+    _mi_section = section
+
+
+def _mi_worker(task: tuple[str, float, float]) -> res.UltimateBendingResults:
+    """Analyses a point on a moment interaction diagram in a worker process.
+
+    Args:
+        task: Type of analysis (``"d_n"`` for a given neutral axis depth, or ``"n"``
+            for a given axial force), neutral axis angle and neutral axis depth or axial
+            force
+
+    Returns:
+        Ultimate bending results object
+    """
+    analysis_type, theta, value = task
+
+    if analysis_type == "d_n":
+        return _mi_section.calculate_ultimate_section_actions(
+            d_n=value, ultimate_results=res.UltimateBendingResults(theta=theta)
+        )
+
+    return _mi_section.ultimate_bending_capacity(theta=theta, n=value)
@@ -1,36 +1,94 @@
+"""Standard ASTM reinforcing bar properties (US customary units)."""
+
+from __future__ import annotations
+
 from dataclasses import dataclass
 
-REBAR = {
-    "#3": {"As": 0.11, "d_bar": 0.375, "plf": 0.375},
-    "#4": {"As": 0.20, "d_bar": 0.5, "plf": 0.668},
-    "#5": {"As": 0.31, "d_bar": 0.625, "plf": 1.043},
-    "#6": {"As": 0.44, "d_bar": 0.75, "plf": 1.502},
-    "#7": {"As": 0.60, "d_bar": 0.875, "plf": 2.044},
-    "#8": {"As": 0.79, "d_bar": 1.00, "plf": 2.67},
-    "#9": {"As": 1.00, "d_bar": 1.128, "plf": 3.4},
-    "#10": {"As": 1.27, "d_bar": 1.27, "plf": 4.303},
-    "#11": {"As": 1.56, "d_bar": 1.41, "plf": 5.313},
-    "#14": {"As": 2.25, "d_bar": 1.693, "plf": 7.65},
-    "#18": {"As": 4.00, "d_bar": 2.257, "plf": 13.6},
-}
+import numpy as np
+
+
+def _read_only(values: list) -> np.ndarray:
+    """Returns a read-only array of ``values``.
+
+    Args:
+        values: Values to store in the array
+
+    Returns:
+        Read-only array
+    """
+    arr = np.array(values)
+    arr.flags.writeable = False
+
+    return arr
+
+
+# bar designations, areas (in^2), nominal diameters (in) and weights (lb/ft), stored
+# as arrays to allow vectorised selection over bar sizes
+_NAMES = _read_only(
+    ["#3", "#4", "#5", "#6", "#7", "#8", "#9", "#10", "#11", "#14", "#18", "#20"]
+)
+_AS = _read_only(
+    [0.11, 0.20, 0.31, 0.44, 0.60, 0.79, 1.00, 1.27, 1.56, 2.25, 4.00, 4.91]
+)
+_DBAR = _read_only(
+    [0.375, 0.5, 0.625, 0.75, 0.875, 1.0, 1.128, 1.27, 1.41, 1.693, 2.257, 2.5]
+)
+_PLF = _read_only(
+    [0.376, 0.668, 1.043, 1.502, 2.044, 2.67, 3.4, 4.303, 5.313, 7.65, 13.6, 16.63]
+)
+_IDX = {name: idx for idx, name in enumerate(_NAMES.tolist())}
 
 
 @dataclass
 class Rebar:
+    """Properties of a reinforcing bar.
+
+    Args:
+        As: Nominal area of the bar
+        d_bar: Nominal diameter of the bar
+        plf: Weight of the bar per unit length
+    """
+
     As: float
     d_bar: float
     plf: float
 
 
-N3 = Rebar(As=0.11, d_bar=0.375, plf=0.376)
-N4 = Rebar(As=0.2, d_bar=0.5, plf=0.668)
-N5 = Rebar(As=0.31, d_bar=0.625, plf=1.043)
-N6 = Rebar(As=0.44, d_bar=0.75, plf=1.502)
-N7 = Rebar(As=0.6, d_bar=0.875, plf=2.044)
-N8 = Rebar(As=0.79, d_bar=1.0, plf=2.67)
-N9 = Rebar(As=1.0, d_bar=1.128, plf=3.4)
-N10 = Rebar(As=1.27, d_bar=1.27, plf=4.303)
-N11 = Rebar(As=1.56, d_bar=1.41, plf=5.313)
-N14 = Rebar(As=2.25, d_bar=1.693, plf=7.65)
-N18 = Rebar(As=4.00, d_bar=2.257, plf=13.6)
-N20 = Rebar(As=4.91, d_bar=2.5, plf=16.63)
+def get_rebar(name: str) -> Rebar:
+    """Returns the properties of a standard reinforcing bar.
+
+    Args:
+        name: Bar designation, e.g. ``"#5"``
+
+    Raises:
+        ValueError: If ``name`` is not a standard bar designation
+
+    Returns:
+        Reinforcing bar properties
+    """
+    try:
+        idx = _IDX[name]
+    except KeyError as exc:
+        msg = f"{name} is not a standard bar designation, use one of {list(_IDX)}."
+        raise ValueError(msg) from exc
+
+    return Rebar(As=float(_AS[idx]), d_bar=float(_DBAR[idx]), plf=float(_PLF[idx]))
+
+
+REBAR = {
+    name: {"As": float(a_s), "d_bar": float(d_bar), "plf": float(plf)}
+    for name, a_s, d_bar, plf in zip(_NAMES.tolist(), _AS, _DBAR, _PLF)
+}
+
+N3 = get_rebar("#3")
+N4 = get_rebar("#4")
+N5 = get_rebar("#5")
+N6 = get_rebar("#6")
+N7 = get_rebar("#7")
+N8 = get_rebar("#8")
+N9 = get_rebar("#9")
+N10 = get_rebar("#10")
+N11 = get_rebar("#11")
+N14 = get_rebar("#14")
+N18 = get_rebar("#18")
+N20 = get_rebar("#20")
@@ -1,19 +1,32 @@
 """ACI 318 class for designing to the ACI318-19 Code, Imperial"""
 
-from dataclasses import dataclass
+from __future__ import annotations
 
-# from typing import TYPE_CHECKING
+import math
+import warnings
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
 import concreteproperties.results as res
 import concreteproperties.stress_strain_profile as ssp
-import concreteproperties.utils as utils
 from concreteproperties.design_codes.design_code import DesignCode
 from concreteproperties.material import Concrete, SteelBar
 
-# if TYPE_CHECKING:
-#     from concreteproperties.concrete_section import ConcreteSection
+# converts densities from kcf to kci
+_KCF_TO_KCI = 1.0 / 1728.0
+
+# (beta_1, Ec, f_r) for standard f'c values (ksi), normal weight concrete, populated
+# once the ACI318 class is defined
+_ACI_TABLE: dict[float, tuple[float, float, float]] = {}
+
+# warning raised when f'c is below the lower limit of ACI 318-19 Table 22.2.2.4.3
+_LOW_FPC_WARNING = "f'c is less than 2.5ksi - assuming beta_1 = 0.85."
+
+# axial strength factors for the type of transverse reinforcement, ACI 318-19 22.4.2.1
+_TIE_FACTOR = {"other": 0.8, "spiral": 0.85}
 
 
 class ACI318(DesignCode):
@@ -24,14 +37,8 @@ class ACI318(DesignCode):
         self.analysis_code = "ACI 318-19"
         super().__init__()
 
-    # def assign_concrete_section(
-    #     self,
-    #     concrete_section: ConcreteSection,
-    # ) -> None:
-    #     """Assigns a concrete section to ACI 318"""
-    #     raise NotImplementedError
-
-    def calc_beta_1(self, fpc: float) -> float:
+    @staticmethod
+    def calc_beta_1(fpc: float) -> float:
         """Calculate Beta_1 in accordance with ACI 318 Table 22.2.2.4.3.
 
         Args:
@@ -40,18 +47,27 @@ class ACI318(DesignCode):
         Returns:
             Beta_1
         """
-        if fpc >= 2.5 and fpc <= 4.0:
-            beta_1 = 0.85
-        elif fpc > 4.0 and fpc < 8.0:
-            beta_1 = 0.85 - (0.05 * (fpc - 4))
-        elif fpc >= 8.0:
-            beta_1 = 0.65
-        else:
-            print("f'c is less than 2.5ksi - assuming beta_1 = 0.85.")
-            return 0.85
-        return beta_1
-
-    def calc_modulus_of_rupture(self, fpc: float, lambda_agg: float = 1.0) -> float:
+        if fpc < 2.5:
+            warnings.warn(_LOW_FPC_WARNING, RuntimeWarning, stacklevel=2)
+
+        return _calc_beta_1(fpc=fpc)
+
+    @staticmethod
+    def calc_beta_1_vec(fpc: list[float] | np.ndarray) -> np.ndarray:
+        """Calculate Beta_1 for an array of f'c values, see :meth:`calc_beta_1`.
+
+        Args:
+            fpc: f'c values in ksi
+
+        Returns:
+            Beta_1 values
+        """
+        return np.clip(
+            0.85 - 0.05 * (np.asarray(fpc, dtype=np.float64) - 4.0), 0.65, 0.85
+        )
+
+    @staticmethod
+    def calc_modulus_of_rupture(fpc: float, lambda_agg: float = 1.0) -> float:
         """
         Calculate modulus of rupture, f_r in accordance with ACI 318.
 
@@ -59,10 +75,16 @@ class ACI318(DesignCode):
             fpc: f'c (ksi)
             lambda_agg: lightweight aggregate factor = 1.0 for normal weight
         """
-        fr = 7.5 * lambda_agg * ((fpc * 1000) ** 0.5) / 1000  # ksi
-        return fr
+        if lambda_agg == 1.0:
+            v = _ACI_TABLE.get(fpc)
 
-    def calc_concrete_elastic_modulus(self, fpc: float, wc: float = 0.145) -> float:
+            if v is not None:
+                return v[2]
+
+        return 7.5 * lambda_agg * math.sqrt(fpc * 1000.0) * 1e-3  # ksi
+
+    @staticmethod
+    def calc_concrete_elastic_modulus(fpc: float, wc: float = 0.145) -> float:
         """Calculates the elastic modulus of the concrete section per ACI 318.
 
         Args:
@@ -70,8 +92,15 @@ class ACI318(DesignCode):
             wc: Unreinforced concrete density (kcf), defaulting to normal weight
                 concrete value of 145
         """
-        Ec = 33 * ((wc * 1000) ** 1.5) * ((fpc * 1000) ** 0.5) / 1000  # ksi
-        return Ec
+        if wc == 0.145:
+            v = _ACI_TABLE.get(fpc)
+
+            if v is not None:
+                return v[1]
+
+        w = wc * 1000.0  # pcf
+
+        return 33.0 * w * math.sqrt(w) * math.sqrt(fpc * 1000.0) * 1e-3  # ksi
 
     def create_concrete_material(
         self,
@@ -91,32 +120,18 @@ class ACI318(DesignCode):
             colour: color of the concrete for rendering, defaults to 'lightgrey'
 
         Returns:
-            Concrete material object
+            Concrete material object, a deep copy of a cached material (including its
+            stress-strain profiles) so it can be modified without affecting other calls
         """
-        # Service stress-strain profile
-        Ec = self.calc_concrete_elastic_modulus(fpc, wc)
-        concrete_service = ssp.ConcreteLinearNoTension(
-            elastic_modulus=Ec, ultimate_strain=eps_cu, compressive_strength=0.85 * fpc
-        )
+        # warn here rather than in the cached function so that the warning is raised
+        # on every call and attributed to the caller
+        if fpc < 2.5:
+            warnings.warn(_LOW_FPC_WARNING, RuntimeWarning, stacklevel=2)
 
-        # Ultimate stress-strain profile
-        beta_1 = self.calc_beta_1(fpc)
-        concrete_ultimate = ssp.RectangularStressBlock(
-            compressive_strength=fpc, alpha=0.85, gamma=beta_1, ultimate_strain=eps_cu
+        return deepcopy(
+            _create_concrete_material(fpc=fpc, eps_cu=eps_cu, wc=wc, colour=colour)
         )
 
-        # Define the concrete material
-        fr = self.calc_modulus_of_rupture(fpc)
-        concrete = Concrete(
-            name=f"{fpc} ksi Concrete",
-            density=wc / (12**3),  # kci
-            stress_strain_profile=concrete_service,
-            colour=colour,
-            ultimate_stress_strain_profile=concrete_ultimate,
-            flexural_tensile_strength=fr,
-        )
-        raise concrete
-
     def create_steel_material(
         self,
         fy: float = 60,
@@ -133,20 +148,16 @@ class ACI318(DesignCode):
             eps_fracture: fracture strain of rebar
             density: unit weight of steel (kcf)
             colour: Colour of the steel for rendering
-        """
-        # Rebar stress-strain profile
-        steel_elastic_plastic = ssp.SteelElasticPlastic(
-            yield_strength=fy, elastic_modulus=Es, fracture_strain=eps_fracture
-        )
 
-        # Define rebar material
-        steel = SteelBar(
-            name=f"Grade {fy} Rebar",
-            density=density / (12**3),  # kci
-            stress_strain_profile=steel_elastic_plastic,
-            colour=colour,
+        Returns:
+            Steel bar material object, a deep copy of a cached material (including its
+            stress-strain profile) so it can be modified without affecting other calls
+        """
+        return deepcopy(
+            _create_steel_material(
+                fy=fy, e_s=Es, eps_fracture=eps_fracture, density=density, colour=colour
+            )
         )
-        return steel
 
     def get_gross_properties(
         self,
@@ -328,36 +339,58 @@ class ACI318(DesignCode):
         grade: str
         density: float
 
+    @staticmethod
     def calc_phis(
-        self,
-        tensile_strains: list[float],
+        tensile_strains: float | list[float] | np.ndarray,
         fy: float = 60,
         Es: float = 29000,
         reinf_type: str = "other",
-    ) -> list[float]:
-        """
-        Returns a list of phi values for the given tensile strains per ACI 318-19.
+        as_list: bool = False,
+    ) -> np.ndarray | list[float]:
+        """Returns phi values for the given tensile strains per ACI 318-19.
+
+        Phi is 0.65 up to the tensile yield strain and 0.9 from a tensile strain of
+        0.005, varying linearly in between (ACI 318-19 Table 21.2.2).
+
+        Args:
+            tensile_strains: Net tensile strains in the extreme layer of tension steel,
+                a scalar is treated as a single strain
+            fy: Steel yield strength (ksi)
+            Es: Elastic modulus of the steel (ksi)
+            reinf_type: Type of transverse reinforcement, only ``"other"`` is
+                currently supported
+            as_list: If set to True, returns the phi values as a list
+
+        Raises:
+            NotImplementedError: If ``reinf_type`` is not ``"other"``
+
+        Returns:
+            Phi values
         """
+        if reinf_type != "other":
+            msg = f"reinf_type={reinf_type} is not yet implemented, use 'other'."
+            raise NotImplementedError(msg)
+
+        ts = np.atleast_1d(np.asarray(tensile_strains, dtype=np.float64))
         tensile_yield_strain = fy / Es
-        phis = []
-        if reinf_type == "other":
-            for ts in tensile_strains:
-                if ts <= tensile_yield_strain:
-                    phi = 0.65
-                    phis.append(phi)
-                elif ts > tensile_yield_strain and ts < 0.005:
-                    phi = 0.65 + 0.25 * (ts - tensile_yield_strain) / (
-                        0.005 - tensile_yield_strain
-                    )
-                    phis.append(phi)
-                elif ts >= 0.005:
-                    phi = 0.9
-                    phis.append(phi)
-        else:
-            print("Spiral ties not yet implemented!")
-        return phis
-
-    def calc_Pn(
+
+        # 0.65 up to yield, 0.9 beyond a strain of 0.005 (yield takes precedence)
+        phi = np.where((ts > tensile_yield_strain) & (ts >= 0.005), 0.9, 0.65)
+
+        # linear transition, only exists if the yield strain is less than 0.005
+        band = (ts > tensile_yield_strain) & (ts < 0.005)
+
+        if band.any():
+            slope = 0.25 / (0.005 - tensile_yield_strain)
+            phi[band] = 0.65 + slope * (ts[band] - tensile_yield_strain)
+
+        if as_list:
+            return phi.tolist()
+
+        return phi
+
+    @staticmethod
+    def calc_Pn(  # noqa: N802
         b: float,
         h: float,
         fpc: float,
@@ -366,25 +399,262 @@ class ACI318(DesignCode):
         fy: float = 60,
         tie_type: str = "other",
     ) -> float:
-        """
-        Calculates the nominal axial capacity of a column, not considering
-        slenderness per ACI 318-14 22.4.2
+        """Calculates the nominal axial capacity of a column per ACI 318-14 22.4.2.
+
+        Slenderness is not considered.
 
         Args:
-        b: width of column in inches
-        h: height of column in inches
-        fpc: f'c in ksi
-        num_bars: number of vertical rebar
-        bar_area: area of one of the vertical rebar in sq. inches
-        fy: yield stress of rebar
-        tie_type: either 'other' or 'spiral'
+            b: width of column in inches
+            h: height of column in inches
+            fpc: f'c in ksi
+            num_bars: number of vertical rebar
+            bar_area: area of one of the vertical rebar in sq. inches
+            fy: yield stress of rebar
+            tie_type: either 'other' or 'spiral'
+
+        Returns:
+            Nominal axial capacity (kips)
         """
         gross_area = b * h
         rebar_area = num_bars * bar_area
         p_0 = 0.85 * fpc * (gross_area - rebar_area) + fy * rebar_area
 
-        if tie_type == "other":
-            max_axial_strength = 0.8 * p_0
-        if tie_type == "spiral":
-            max_axial_strength = 0.85 * p_0
-        return max_axial_strength
+        return ACI318.get_tie_factor(tie_type=tie_type) * p_0
+
+    @staticmethod
+    def calc_Pn_batch(  # noqa: N802
+        b: list[float] | np.ndarray,
+        h: list[float] | np.ndarray,
+        fpc: list[float] | np.ndarray,
+        num_bars: list[int] | np.ndarray,
+        bar_area: list[float] | np.ndarray,
+        fy: list[float] | np.ndarray | float = 60,
+        tie_type: str = "other",
+    ) -> np.ndarray:
+        """Calculates the nominal axial capacity of a number of columns.
+
+        Vectorised version of :meth:`calc_Pn`, the input arrays are broadcast against
+        each other.
+
+        Args:
+            b: Widths of the columns (in)
+            h: Heights of the columns (in)
+            fpc: f'c values (ksi)
+            num_bars: Number of vertical bars
+            bar_area: Areas of one of the vertical bars (in^2)
+            fy: Yield stresses of the bars (ksi)
+            tie_type: Either ``"other"`` or ``"spiral"``
+
+        Returns:
+            Nominal axial capacities (kips)
+        """
+        gross_area = np.multiply(b, h, dtype=np.float64)
+        rebar_area = np.multiply(num_bars, bar_area, dtype=np.float64)
+        p_0 = 0.85 * np.asarray(fpc) * (gross_area - rebar_area) + np.multiply(
+            fy, rebar_area
+        )
+
+        return ACI318.get_tie_factor(tie_type=tie_type) * p_0
+
+    @staticmethod
+    def get_tie_factor(tie_type: str) -> float:
+        """Returns the axial strength factor for the type of transverse reinforcement.
+
+        Args:
+            tie_type: Either ``"other"`` or ``"spiral"``
+
+        Raises:
+            ValueError: If ``tie_type`` is not ``"other"`` or ``"spiral"``
+
+        Returns:
+            Axial strength factor
+        """
+        try:
+            return _TIE_FACTOR[tie_type]
+        except KeyError as exc:
+            msg = f"tie_type must be 'other' or 'spiral', not {tie_type}."
+            raise ValueError(msg) from exc
+
+
+def _calc_beta_1(fpc: float) -> float:
+    """Calculate Beta_1 without warning, see :meth:`ACI318.calc_beta_1`.
+
+    Args:
+        fpc: f'c in ksi
+
+    Returns:
+        Beta_1
+    """
+    v = _ACI_TABLE.get(fpc)
+
+    if v is not None:
+        return v[0]
+
+    return min(0.85, max(0.65, 0.85 - 0.05 * (fpc - 4.0)))
+
+
+_ACI_TABLE.update(
+    {
+        fpc: (
+            ACI318.calc_beta_1(fpc),
+            ACI318.calc_concrete_elastic_modulus(fpc),
+            ACI318.calc_modulus_of_rupture(fpc),
+        )
+        for fpc in (2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 10.0)
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _make_linear_no_tension(
+    elastic_modulus: float,
+    ultimate_strain: float,
+    compressive_strength: float,
+) -> ssp.ConcreteLinearNoTension:
+    """Returns a cached linear no tension concrete stress-strain profile.
+
+    Args:
+        elastic_modulus: Elastic modulus of the concrete (ksi)
+        ultimate_strain: Ultimate crushing strain of the concrete
+        compressive_strength: Compressive strength of the concrete (ksi)
+
+    Returns:
+        Linear no tension stress-strain profile
+    """
+    return ssp.ConcreteLinearNoTension(
+        elastic_modulus=elastic_modulus,
+        ultimate_strain=ultimate_strain,
+        compressive_strength=compressive_strength,
+    )
+
+
+@lru_cache(maxsize=64)
+def _make_rect_block(
+    compressive_strength: float,
+    alpha: float,
+    gamma: float,
+    ultimate_strain: float,
+) -> ssp.RectangularStressBlock:
+    """Returns a cached rectangular stress block.
+
+    Args:
+        compressive_strength: Concrete compressive strength (ksi)
+        alpha: Factor that modifies the concrete compressive strength
+        gamma: Factor that modifies the depth of the stress block
+        ultimate_strain: Ultimate crushing strain of the concrete
+
+    Returns:
+        Rectangular stress block
+    """
+    return ssp.RectangularStressBlock(
+        compressive_strength=compressive_strength,
+        alpha=alpha,
+        gamma=gamma,
+        ultimate_strain=ultimate_strain,
+    )
+
+
+@lru_cache(maxsize=64)
+def _make_elastic_plastic(
+    yield_strength: float,
+    elastic_modulus: float,
+    fracture_strain: float,
+) -> ssp.SteelElasticPlastic:
+    """Returns a cached elastic-plastic steel stress-strain profile.
+
+    Args:
+        yield_strength: Steel yield strength (ksi)
+        elastic_modulus: Steel elastic modulus (ksi)
+        fracture_strain: Steel fracture strain
+
+    Returns:
+        Elastic-plastic stress-strain profile
+    """
+    return ssp.SteelElasticPlastic(
+        yield_strength=yield_strength,
+        elastic_modulus=elastic_modulus,
+        fracture_strain=fracture_strain,
+    )
+
+
+@lru_cache(maxsize=128, typed=True)
+def _create_concrete_material(
+    fpc: float,
+    eps_cu: float,
+    wc: float,
+    colour: str,
+) -> Concrete:
+    """Creates a concrete material object to ACI 318.
+
+    See :meth:`ACI318.create_concrete_material`. The cached instance must not be
+    modified, callers receive a deep copy.
+
+    Args:
+        fpc: f'c (ksi)
+        eps_cu: Ultimate crushing strain of concrete
+        wc: density of unreinforced concrete (kcf)
+        colour: color of the concrete for rendering
+
+    Returns:
+        Concrete material object
+    """
+    # Service stress-strain profile
+    e_c = ACI318.calc_concrete_elastic_modulus(fpc, wc)
+    concrete_service = _make_linear_no_tension(
+        elastic_modulus=e_c, ultimate_strain=eps_cu, compressive_strength=0.85 * fpc
+    )
+
+    # Ultimate stress-strain profile
+    beta_1 = _calc_beta_1(fpc=fpc)
+    concrete_ultimate = _make_rect_block(
+        compressive_strength=fpc, alpha=0.85, gamma=beta_1, ultimate_strain=eps_cu
+    )
+
+    # Define the concrete material
+    fr = ACI318.calc_modulus_of_rupture(fpc)
+    concrete = Concrete(
+        name=f"{fpc} ksi Concrete",
+        density=wc * _KCF_TO_KCI,  # kci
+        stress_strain_profile=concrete_service,
+        colour=colour,
+        ultimate_stress_strain_profile=concrete_ultimate,
+        flexural_tensile_strength=fr,
+    )
+    return concrete
+
+
+@lru_cache(maxsize=128, typed=True)
+def _create_steel_material(
+    fy: float,
+    e_s: float,
+    eps_fracture: float,
+    density: float,
+    colour: str,
+) -> SteelBar:
+    """Creates a steel bar material object, see :meth:`ACI318.create_steel_material`.
+
+    The cached instance must not be modified, callers receive a deep copy.
+
+    Args:
+        fy: Steel yield strength (ksi)
+        e_s: Elastic modulus (ksi)
+        eps_fracture: fracture strain of rebar
+        density: unit weight of steel (kcf)
+        colour: Colour of the steel for rendering
+
+    Returns:
+        Steel bar material object
+    """
+    # Rebar stress-strain profile
+    steel_elastic_plastic = _make_elastic_plastic(
+        yield_strength=fy, elastic_modulus=e_s, fracture_strain=eps_fracture
+    )
+
+    # Define rebar material
+    steel = SteelBar(
+        name=f"Grade {fy} Rebar",
+        density=density * _KCF_TO_KCI,  # kci
+        stress_strain_profile=steel_elastic_plastic,
+        colour=colour,
+    )
+    return steel
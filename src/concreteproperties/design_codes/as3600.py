@@ -15,7 +15,11 @@ import concreteproperties.results as res
 import concreteproperties.stress_strain_profile as ssp
 from concreteproperties.design_codes.design_code import DesignCode
 from concreteproperties.material import Concrete, SteelBar
-from concreteproperties.utils import AnalysisError, create_known_progress
+from concreteproperties.utils import (
+    AnalysisError,
+    create_known_progress,
+    show_progress,
+)
 
 
 if TYPE_CHECKING:
@@ -624,7 +628,7 @@ class AS3600(DesignCode):
                 if progress:
                     progress.update(task, advance=1)
 
-        if progress_bar:
+        if show_progress(progress_bar=progress_bar):
             # create progress bar
             progress = create_known_progress()
 
@@ -1875,7 +1875,7 @@ class NZS3101(DesignCode):
                 if progress:
                     progress.update(task, advance=1)
 
-        if progress_bar:
+        if utils.show_progress(progress_bar=progress_bar):
             # create progress bar
             progress = utils.create_known_progress()
 
@@ -31,6 +31,9 @@ class CPGeom:
     optimised for ``concreteproperties``.
     """
 
+    # a section holds one geometry per bar, use slots to avoid a __dict__ per instance
+    __slots__ = ("geom", "material", "points", "facets", "holes", "_area", "_centroid")
+
     def __init__(
         self,
         geom: Polygon,
@@ -58,6 +61,10 @@ class CPGeom:
             hole_polygon = Polygon(hole)
             self.holes += tuple(hole_polygon.representative_point().coords)
 
+        # area and centroid, calculated when first required
+        self._area: float | None = None
+        self._centroid: tuple[float, float] | None = None
+
     def round_geometry(
         self,
         geometry: Polygon,
@@ -147,18 +154,28 @@ class CPGeom:
     def calculate_area(self) -> float:
         """Calculates the area of the geometry.
 
+        The geometry does not change, so the area is only calculated once.
+
         Returns:
             Geometry area
         """
-        return self.geom.area
+        if self._area is None:
+            self._area = self.geom.area
+
+        return self._area
 
     def calculate_centroid(self) -> tuple[float, float]:
         """Calculates the centroid of the geometry.
 
+        The geometry does not change, so the centroid is only calculated once.
+
         Returns:
             Geometry centroid
         """
-        return self.geom.centroid.coords[0]
+        if self._centroid is None:
+            self._centroid = self.geom.centroid.coords[0]
+
+        return self._centroid
 
     def calculate_extents(self) -> tuple[float, float, float, float]:
         """Calculates the extents of the geometry.
@@ -187,51 +204,107 @@ class CPGeom:
         Returns:
             Geometries above and below the line
         """
+        top_polys, bot_polys = self.split_polygon(
+            polygon=self.geom, point=point, theta=theta
+        )
+
+        # assign material properties and create cp geometry objects
+        top_geoms = [self.create_cp_geom(polygon=poly) for poly in top_polys]
+        bot_geoms = [self.create_cp_geom(polygon=poly) for poly in bot_polys]
+
+        return top_geoms, bot_geoms
+
+    def split_polygon(
+        self,
+        polygon: Polygon,
+        point: tuple[float, float],
+        theta: float,
+    ) -> tuple[list[Polygon], list[Polygon]]:
+        """Splits a polygon about a line.
+
+        Allows a polygon to be split repeatedly, e.g. at several strains, without
+        creating intermediate geometry objects. Split polygons are rounded in the same
+        way as the geometry.
+
+        Args:
+            polygon: Polygon to split
+            point: Point on line
+            theta: Angle line makes with horizontal axis
+
+        Returns:
+            Polygons above and below the line
+        """
         # round point
         point = np.round(point, 6)
 
         # generate unit vector
         vector = np.cos(theta), np.sin(theta)
 
-        # calculate bounds of geometry
-        bounds = self.calculate_extents()
+        # calculate bounds of polygon
+        min_x, min_y, max_x, max_y = polygon.bounds
+        bounds = min_x, max_x, min_y, max_y
 
-        # generate line segment that matches bounds of geometry object
-        line_seg = self.create_line_segment(point=point, vector=vector, bounds=bounds)
-
-        # check to see if line intersects geometry
-        if line_seg.intersects(self.geom):
-            # split geometries
-            polys = split(geom=self.geom, splitter=line_seg).geoms
+        # signed distances (scaled) of the corners of the bounding box from the line,
+        # positive is above the line
+        if abs(vector[0]) > 1e-12:
+            v_ratio = vector[1] / vector[0]
+            dists = [
+                y - point[1] - (x - point[0]) * v_ratio
+                for x in (min_x, max_x)
+                for y in (min_y, max_y)
+            ]
+        else:
+            dists = [min_x - point[0], max_x - point[0]]
+
+        # if the bounding box lies entirely on one side of the line, there is no need
+        # to split the polygon
+        if min(dists) > 0:
+            top_polys, bot_polys = [polygon], []
+        elif max(dists) < 0:
+            top_polys, bot_polys = [], [polygon]
         else:
-            polys = [self.geom]
+            # generate line segment that matches bounds of polygon
+            line_seg = self.create_line_segment(
+                point=point, vector=vector, bounds=bounds
+            )
 
-        # sort geometries
-        top_polys, bot_polys = self.sort_polys(polys=polys, point=point, vector=vector)
+            # check to see if line intersects polygon
+            if line_seg.intersects(polygon):
+                # split polygons
+                polys = [
+                    self.round_geometry(geometry=poly, tol=6)
+                    for poly in split(geom=polygon, splitter=line_seg).geoms
+                ]
+            else:
+                polys = [polygon]
 
-        # assign material properties and create cp geometry objects
-        top_geoms = [
-            (
-                CPGeomConcrete(geom=poly, material=self.material)
-                if isinstance(self.material, Concrete)
-                else CPGeom(geom=poly, material=self.material)
+            # sort polygons
+            top_polys, bot_polys = self.sort_polys(
+                polys=polys, point=point, vector=vector
             )
-            for poly in top_polys
-        ]
-        bot_geoms = [
-            (
-                CPGeomConcrete(geom=poly, material=self.material)
-                if isinstance(self.material, Concrete)
-                else CPGeom(geom=poly, material=self.material)
-            )
-            for poly in bot_polys
-        ]
 
-        # ensure top geoms is in compression
+        # ensure top polys is in compression
         if theta <= np.pi / 2 and theta >= -np.pi / 2:
-            return top_geoms, bot_geoms
+            return top_polys, bot_polys
+        else:
+            return bot_polys, top_polys
+
+    def create_cp_geom(
+        self,
+        polygon: Polygon,
+    ) -> CPGeom | CPGeomConcrete:
+        """Creates a geometry object from a polygon with the material of this geometry.
+
+        Args:
+            polygon: Shapely polygon defining the geometry
+
+        Returns:
+            Geometry object, ``CPGeomConcrete`` if the material is ``Concrete``
+        """
+        if isinstance(self.material, Concrete):
+            return CPGeomConcrete(geom=polygon, material=self.material)
         else:
-            return bot_geoms, top_geoms
+            return CPGeom(geom=polygon, material=self.material)
 
     def create_line_segment(
         self,
@@ -348,6 +421,8 @@ class CPGeom:
 class CPGeomConcrete(CPGeom):
     """A ``concreteproperties`` Geometry object for concrete geometries."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         geom: Polygon,
@@ -146,9 +146,7 @@ class PrestressedSection(ConcreteSection):
 
         # set neutral axis depth limits
         # depth of neutral axis at extreme tensile fibre
-        _, d_t = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=0
-        )
+        _, d_t = self._get_extreme_fibre(theta=0)
         a = 1e-6 * d_t  # sufficiently small depth of compressive zone
         b = d_t  # neutral axis at extreme tensile fibre
 
@@ -265,9 +263,7 @@ class PrestressedSection(ConcreteSection):
 
         def calc_min_stress():
             # calculate extreme fibre in global coordinates
-            extreme_fibre, d_t = utils.calculate_extreme_fibre(
-                points=self.compound_geometry.points, theta=theta
-            )
+            extreme_fibre, d_t = self._get_extreme_fibre(theta=theta)
 
             # find point on neutral axis by shifting by d_nc
             point_na = utils.point_on_neutral_axis(
@@ -751,9 +747,7 @@ class PrestressedSection(ConcreteSection):
         strand_forces = []
 
         # get global coordinates of extreme compressive fibre
-        ecf, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=0
-        )
+        ecf, _ = self._get_extreme_fibre(theta=0)
 
         # create splits in meshed geometries at points in stress-strain profiles
         meshed_split_geoms: list[CPGeom | CPGeomConcrete] = []
@@ -865,9 +859,7 @@ class PrestressedSection(ConcreteSection):
             Stress results object
         """
         # depth of neutral axis at extreme tensile fibre
-        extreme_fibre, _ = utils.calculate_extreme_fibre(
-            points=self.compound_geometry.points, theta=ultimate_results.theta
-        )
+        extreme_fibre, _ = self._get_extreme_fibre(theta=ultimate_results.theta)
 
         # find point on neutral axis by shifting by d_n
         if isinf(ultimate_results.d_n):
@@ -724,6 +724,35 @@ class MomentInteractionResults:
 
         return n_list, m_list
 
+    def get_results_arrays(
+        self,
+        moment: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns arrays of axial forces and moments.
+
+        Args:
+            moment: Which moment to return, acceptable values are ``"m_x"``, ``"m_y"``
+                or ``"m_xy"``
+
+        Raises:
+            ValueError: If the moment string is not valid
+
+        Returns:
+            Arrays of axial forces and moments (``n``, ``m``)
+        """
+        if moment not in ("m_x", "m_y", "m_xy"):
+            raise ValueError(f"{moment} not an acceptable value for moment.")
+
+        # fill preallocated arrays with results
+        n_arr = np.empty(len(self.results))
+        m_arr = np.empty(len(self.results))
+
+        for idx, result in enumerate(self.results):
+            n_arr[idx] = result.n
+            m_arr[idx] = getattr(result, moment)
+
+        return n_arr, m_arr
+
     def plot_diagram(
         self,
         n_scale: float = 1e-3,
@@ -757,11 +786,11 @@ class MomentInteractionResults:
             assert ax
 
             # get results
-            n_list, m_list = self.get_results_lists(moment=moment)
+            n_arr, m_arr = self.get_results_arrays(moment=moment)
 
             # scale results
-            forces = np.array(n_list) * n_scale
-            moments = np.array(m_list) * m_scale
+            forces = n_arr * n_scale
+            moments = m_arr * m_scale
 
             # plot diagram
             ax.plot(moments, forces, fmt)
@@ -775,12 +804,8 @@ class MomentInteractionResults:
                     y_diff = ax.get_ylim()
                     ar = (y_diff[1] - y_diff[0]) / (x_diff[1] - x_diff[0])
 
-                for idx, m in enumerate(m_list):
+                for idx, (x, y) in enumerate(zip(moments, forces)):
                     if self.results[idx].label:
-                        # get x,y position on plot
-                        x = m * m_scale
-                        y = n_list[idx] * n_scale
-
                         if label_offset:
                             # calculate text offset
                             grad_pt = grad[1, idx] / grad[0, idx] / ar
@@ -848,11 +873,11 @@ class MomentInteractionResults:
 
             # for each M-N curve
             for idx, mi_result in enumerate(moment_interaction_results):
-                n_list, m_list = mi_result.get_results_lists(moment=moment)
+                n_arr, m_arr = mi_result.get_results_arrays(moment=moment)
 
                 # scale results
-                forces = np.array(n_list) * n_scale
-                moments = np.array(m_list) * m_scale
+                forces = n_arr * n_scale
+                moments = m_arr * m_scale
 
                 ax.plot(moments, forces, fmt, label=labels[idx])
 
@@ -884,15 +909,10 @@ class MomentInteractionResults:
             True, if combination of axial force and moment is within the diagram
         """
         # get results
-        n_list, m_list = self.get_results_lists(moment=moment)
+        n_arr, m_arr = self.get_results_arrays(moment=moment)
 
         # create a polygon from points on diagram
-        poly_points = []
-
-        for idx, mom in enumerate(m_list):
-            poly_points.append((mom, n_list[idx]))
-
-        poly = Polygon(poly_points)
+        poly = Polygon(np.column_stack((m_arr, n_arr)))
         point = Point(m, n)
 
         return poly.contains(point)
@@ -925,7 +925,8 @@ class RectangularStressBlock(ConcreteUltimateProfile):
         """Returns a stress given a strain.
 
         Overrides parent method with small tolerance to aid ultimate stress generation
-        at nodes.
+        at nodes. ``strain`` may also be an array of strains, in which case an array of
+        stresses is returned.
 
         Args:
             strain: Strain at which to return a stress.
@@ -933,6 +934,11 @@ class RectangularStressBlock(ConcreteUltimateProfile):
         Returns:
             Stress
         """
+        if np.ndim(strain) > 0:
+            return np.where(
+                np.asarray(strain) >= self.strains[1] - 1e-8, self.stresses[2], 0.0
+            )
+
         if strain >= self.strains[1] - 1e-8:
             return self.stresses[2]
         else:
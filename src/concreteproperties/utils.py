@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from math import cos, sin
 from typing import TYPE_CHECKING
 
 import numpy as np
+from rich.console import Console
 from rich.progress import BarColumn, Progress, ProgressColumn, SpinnerColumn, TextColumn
 from rich.table import Column
 from rich.text import Text
@@ -14,8 +16,10 @@ from concreteproperties.pre import CPGeomConcrete
 
 if TYPE_CHECKING:
     from sectionproperties.pre.geometry import CompoundGeometry
+    from shapely import Polygon
 
     from concreteproperties.pre import CPGeom
+    from concreteproperties.stress_strain_profile import StressStrainProfile
 
 
 def get_service_strain(
@@ -30,6 +34,9 @@ def get_service_strain(
     Determines the strain at point ``point`` given curvature ``kappa`` and neutral axis
     angle ``theta``. Positive strain is compression.
 
+    ``point`` may also contain arrays of ``x`` and ``y`` coordinates, in which case an
+    array of strains is returned.
+
     Args:
         point: Point at which to evaluate the strain
         ecf: Global coordinate of the extreme compressive fibre
@@ -65,6 +72,9 @@ def get_ultimate_strain(
     Determines the strain at point ``point`` given neutral axis depth ``d_n`` and
     neutral axis angle ``theta``. Positive strain is compression.
 
+    ``point`` may also contain arrays of ``x`` and ``y`` coordinates, in which case an
+    array of strains is returned.
+
     Args:
         point: Point at which to evaluate the strain
         point_na: Point on the neutral axis
@@ -123,6 +133,7 @@ def split_geom_at_strains_service(
     ecf: tuple[float, float],
     eps0: float,
     kappa: float,
+    strains: list[float] | np.ndarray | None = None,
 ) -> list[CPGeom] | list[CPGeomConcrete]:
     r"""Splits geometries at discontinuities in its stress-strain profile.
 
@@ -133,6 +144,8 @@ def split_geom_at_strains_service(
         ecf: Global coordinate of the extreme compressive fibre
         eps0: Strain at top fibre
         kappa: Curvature
+        strains: Ordered unique strains in the stress-strain profile of ``geom``, if
+            not provided these are computed from the material
 
     Returns:
         List of split geometries
@@ -142,59 +155,56 @@ def split_geom_at_strains_service(
         return [geom]
 
     # create splits in concrete geometries at points in stress-strain profiles
-    split_geoms: list[CPGeom] | list[CPGeomConcrete] = []
-
-    strains = geom.material.stress_strain_profile.get_unique_strains()
-
-    # make geom a list of geometries
-    geom_list = [geom]
+    split_polys: list[Polygon] = []
 
-    # initialise top_geoms in case of two unique strains
-    top_geoms = geom_list
-    continuing_geoms = []
+    if strains is None:
+        strains = geom.material.stress_strain_profile.get_unique_strains()
 
-    # loop through intermediate points on stress-strain profile
-    for strain in strains[1:-1]:
-        # depth to points of *strain* from ecf
-        d = (eps0 - strain) / kappa
+    # split the raw polygons, geometry objects are created once splitting is complete
+    polygons = [geom.geom]
+    continuing_polys = []
 
-        # convert depth to global coordinates
-        dx, dy = local_to_global(theta=theta, u=0, v=d)
+    # depths to intermediate points on stress-strain profile from ecf
+    d = (eps0 - np.asarray(strains[1:-1], dtype=float)) / kappa
 
-        # calculate location of point
-        pt = ecf[0] - dx, ecf[1] - dy
+    # convert depths to global coordinates and calculate locations of points
+    dx, dy = local_to_global(theta=theta, u=0, v=d)
+    pts = zip(ecf[0] - dx, ecf[1] - dy)
 
-        # make list of geometries that will need to continue to be split after the
+    # loop through intermediate points on stress-strain profile
+    for pt in pts:
+        # make list of polygons that will need to continue to be split after the
         # split operation, i.e. those above the split
-        continuing_geoms = []
+        continuing_polys = []
 
-        # split concrete geometries
-        for g in geom_list:
-            top_geoms, bot_geoms = g.split_section(
+        # split concrete polygons
+        for poly in polygons:
+            top_polys, bot_polys = geom.split_polygon(
+                polygon=poly,
                 point=pt,
                 theta=theta,
             )
 
             if kappa < 0:
-                # save top geoms
-                split_geoms.extend(top_geoms)
+                # save top polys
+                split_polys.extend(top_polys)
 
-                # save continuing geoms
-                continuing_geoms.extend(bot_geoms)
+                # save continuing polys
+                continuing_polys.extend(bot_polys)
             else:
-                # save bot geoms
-                split_geoms.extend(bot_geoms)
+                # save bot polys
+                split_polys.extend(bot_polys)
 
-                # save continuing geoms
-                continuing_geoms.extend(top_geoms)
+                # save continuing polys
+                continuing_polys.extend(top_polys)
 
-        # update geom_list for next strain
-        geom_list = continuing_geoms
+        # update polygons for next strain
+        polygons = continuing_polys
 
-    # save final top geoms
-    split_geoms.extend(continuing_geoms)
+    # save final top polys
+    split_polys.extend(continuing_polys)
 
-    return split_geoms
+    return create_split_geoms(geom=geom, polygons=split_polys)
 
 
 def split_geom_at_strains_ultimate(
@@ -203,6 +213,7 @@ def split_geom_at_strains_ultimate(
     point_na: tuple[float, float],
     ultimate_strain: float,
     d_n: float,
+    strains: list[float] | np.ndarray | None = None,
 ) -> list[CPGeom] | list[CPGeomConcrete]:
     r"""Splits geometries at discontinuities in its stress-strain profile.
 
@@ -215,60 +226,104 @@ def split_geom_at_strains_ultimate(
             only)
         d_n: Depth of the neutral axis from the extreme compression fibre (required
             for ``ultimate=True`` only)
+        strains: Ordered unique strains in the ultimate stress-strain profile of
+            ``geom``, if not provided these are computed from the material
 
     Returns:
         List of split geometries
     """
     # create splits in concrete geometries at points in stress-strain profiles
-    split_geoms: list[CPGeom] | list[CPGeomConcrete] = []
+    split_polys: list[Polygon] = []
 
-    if isinstance(geom, CPGeomConcrete):
-        strains = geom.material.ultimate_stress_strain_profile.get_unique_strains()
-    else:
-        strains = geom.material.stress_strain_profile.get_unique_strains()
-
-    # make geom a list of geometries
-    geom_list = [geom]
+    if strains is None:
+        if isinstance(geom, CPGeomConcrete):
+            strains = geom.material.ultimate_stress_strain_profile.get_unique_strains()
+        else:
+            strains = geom.material.stress_strain_profile.get_unique_strains()
 
-    # initialise top_geoms in case of two unique strains
-    top_geoms = geom_list
-    continuing_geoms = []
+    # split the raw polygons, geometry objects are created once splitting is complete
+    polygons = [geom.geom]
+    continuing_polys = []
 
-    # loop through intermediate points on stress-strain profile
-    for strain in strains[1:-1]:
-        # depth to points of *strain* from NA
-        d = strain / ultimate_strain * d_n
-
-        # convert depth to global coordinates
-        dx, dy = local_to_global(theta=theta, u=0, v=d)
+    # depths to intermediate points on stress-strain profile from NA
+    d = np.asarray(strains[1:-1], dtype=float) / ultimate_strain * d_n
 
-        # calculate location of point
-        pt = point_na[0] + dx, point_na[1] + dy
+    # convert depths to global coordinates and calculate locations of points
+    dx, dy = local_to_global(theta=theta, u=0, v=d)
+    pts = zip(point_na[0] + dx, point_na[1] + dy)
 
-        # make list of geometries that will need to continue to be split after the
+    # loop through intermediate points on stress-strain profile
+    for pt in pts:
+        # make list of polygons that will need to continue to be split after the
         # split operation, i.e. those above the split
-        continuing_geoms = []
+        continuing_polys = []
 
-        # split concrete geometries (from bottom up)
-        for g in geom_list:
-            top_geoms, bot_geoms = g.split_section(
+        # split concrete polygons (from bottom up)
+        for poly in polygons:
+            top_polys, bot_polys = geom.split_polygon(
+                polygon=poly,
                 point=pt,
                 theta=theta,
             )
 
-            # save bottom geoms
-            split_geoms.extend(bot_geoms)
+            # save bottom polys
+            split_polys.extend(bot_polys)
+
+            # save continuing polys
+            continuing_polys.extend(top_polys)
+
+        # update polygons for next strain
+        polygons = continuing_polys
+
+    # save final top polys
+    split_polys.extend(continuing_polys)
+
+    return create_split_geoms(geom=geom, polygons=split_polys)
+
+
+def create_split_geoms(
+    geom: CPGeom | CPGeomConcrete,
+    polygons: list[Polygon],
+) -> list[CPGeom] | list[CPGeomConcrete]:
+    """Creates geometry objects from the polygons resulting from splitting ``geom``.
+
+    Polygons that were not split reuse ``geom``, retaining any cached properties.
+
+    Args:
+        geom: Geometry that was split
+        polygons: Split polygons
+
+    Returns:
+        List of split geometries
+    """
+    return [
+        geom if poly is geom.geom else geom.create_cp_geom(polygon=poly)
+        for poly in polygons
+    ]
 
-            # save continuing geoms
-            continuing_geoms.extend(top_geoms)
 
-        # update geom_list for next strain
-        geom_list = continuing_geoms
+def group_by_profile(
+    geoms: list[CPGeom],
+) -> list[tuple[StressStrainProfile, list[int]]]:
+    """Groups geometries by the stress-strain profile of their material.
 
-    # save final top geoms
-    split_geoms.extend(continuing_geoms)
+    Allows stresses to be evaluated for all geometries sharing a stress-strain profile
+    in a single call.
 
-    return split_geoms
+    Args:
+        geoms: List of geometries to group
+
+    Returns:
+        List of stress-strain profiles and the indices of the geometries in ``geoms``
+        that use each profile
+    """
+    groups: dict[int, tuple[StressStrainProfile, list[int]]] = {}
+
+    for idx, geom in enumerate(geoms):
+        profile = geom.material.stress_strain_profile
+        groups.setdefault(id(profile), (profile, []))[1].append(idx)
+
+    return list(groups.values())
 
 
 def calculate_extreme_fibre(
@@ -289,24 +344,14 @@ def calculate_extreme_fibre(
         Global coordinate of the extreme compression fibre (``x``, ``y``) and the
         neutral axis depth at the extreme tensile fibre
     """
-    # initialise min/max variable & point
-    max_pt = points[0]
-    _, v = global_to_local(theta=theta, x=points[0][0], y=points[0][1])
-    v_min = v
-    v_max = v
-
-    # loop through all points
-    for point in points[1:]:
-        # determine the coordinate of the point wrt the local axis
-        _, v = global_to_local(theta=theta, x=point[0], y=point[1])
+    # determine the coordinates of all points wrt the local axis
+    pts = np.asarray(points, dtype=float)
+    _, v = global_to_local(theta=theta, x=pts[:, 0], y=pts[:, 1])
 
-        # update the min/max & point where necessary
-        if v < v_min:
-            v_min = v
-
-        if v > v_max:
-            v_max = v
-            max_pt = point
+    # the first point with the maximum v is the extreme compression fibre
+    max_pt = points[int(np.argmax(v))]
+    v_min = float(v.min())
+    v_max = float(v.max())
 
     # calculate depth of neutral axis at tensile fibre
     d_t = v_max - v_min
@@ -333,16 +378,11 @@ def calculate_max_bending_depth(
     Returns:
         Maximum bending depth, returns zero if distance is negative
     """
-    max_bending_depth = 0
-
-    # loop through all points
-    for point in points:
-        # determine the coordinate of the point wrt the local axis
-        _, v = global_to_local(theta=theta, x=point[0], y=point[1])
-
-        max_bending_depth = max(c_local_v - v, max_bending_depth)
+    # determine the coordinates of all points wrt the local axis
+    pts = np.asarray(points, dtype=float)
+    _, v = global_to_local(theta=theta, x=pts[:, 0], y=pts[:, 1])
 
-    return max_bending_depth
+    return max(float(np.max(c_local_v - v)), 0)
 
 
 def gauss_points(n: float) -> list[list[float]]:
@@ -421,24 +461,14 @@ def calculate_local_extents(
     Returns:
         Local extents (``x11_max``, ``x11_min``, ``y22_max``, ``y22_min``)
     """
-    # initialise min, max variables
-    pt0 = geometry.points[0]
-    x11, y22 = global_to_local(theta=theta, x=pt0[0] - cx, y=pt0[1] - cy)
-    x11_max = x11
-    x11_min = x11
-    y22_max = y22
-    y22_min = y22
-
-    # loop through all points in geometry
-    for pt in geometry.points[1:]:
-        # determine the coordinate of the point wrt the principal axis
-        x11, y22 = global_to_local(theta=theta, x=pt[0] - cx, y=pt[1] - cy)
-
-        # update the mins and maxes where necessary
-        x11_max = max(x11_max, x11)
-        x11_min = min(x11_min, x11)
-        y22_max = max(y22_max, y22)
-        y22_min = min(y22_min, y22)
+    # determine the coordinates of all points wrt the principal axis
+    pts = np.asarray(geometry.points, dtype=float)
+    x11, y22 = global_to_local(theta=theta, x=pts[:, 0] - cx, y=pts[:, 1] - cy)
+
+    x11_max = float(x11.max())
+    x11_min = float(x11.min())
+    y22_max = float(y22.max())
+    y22_min = float(y22.min())
 
     return x11_max, x11_min, y22_max, y22_min
 
@@ -451,7 +481,7 @@ def global_to_local(
     r"""Calculates local coorindates.
 
     Determines the local coordinates of the global point (``x``, ``y``) given local
-    axis angle ``theta``.
+    axis angle ``theta``. ``x`` and ``y`` may also be arrays of coordinates.
 
     Args:
         theta: Angle (in radians) the local axis makes with the horizontal axis
@@ -462,8 +492,8 @@ def global_to_local(
     Returns:
         Local axis coordinates (``u``, ``v``)
     """
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    cos_theta = cos(theta)
+    sin_theta = sin(theta)
 
     return x * cos_theta + y * sin_theta, y * cos_theta - x * sin_theta
 
@@ -487,8 +517,8 @@ def local_to_global(
     Returns:
         Global axis coordinates (``x``, ``y``)
     """
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    cos_theta = cos(theta)
+    sin_theta = sin(theta)
 
     return u * cos_theta - v * sin_theta, u * sin_theta + v * cos_theta
 
@@ -518,6 +548,28 @@ class CustomTimeElapsedColumn(ProgressColumn):
         return Text(elapsed_string, style="progress.elapsed")
 
 
+def show_progress(progress_bar: bool) -> bool:
+    """Returns whether or not to display a progress bar.
+
+    Progress bars are only displayed in a terminal or Jupyter notebook, as redrawing
+    them when the output is redirected (e.g. to a file or pipe) only adds overhead.
+    Set the ``FORCE_COLOR`` environment variable (read by ``rich``) to always display
+    progress bars, e.g. in IDE run consoles or CI logs.
+
+    Args:
+        progress_bar: Whether or not a progress bar has been requested
+
+    Returns:
+        True if a progress bar should be displayed
+    """
+    if not progress_bar:
+        return False
+
+    console = Console()
+
+    return console.is_terminal or console.is_jupyter
+
+
 def create_known_progress() -> Progress:
     """Returns a Rich Progress class for a known number of iterations.
 
@@ -0,0 +1,193 @@
+"""Tests for the ACI318 design code module."""
+
+import numpy as np
+import pytest
+from sectionproperties.pre.library.concrete_sections import (
+    concrete_rectangular_section,
+)
+
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.design_codes.ACI318_rebar import N3, N20, REBAR, get_rebar
+from concreteproperties.design_codes.aci318 import ACI318
+from concreteproperties.material import Concrete, SteelBar
+
+
+def test_rebar_table():
+    """Tests the standard reinforcing bar table."""
+    assert get_rebar("#3") == N3
+    assert pytest.approx(N3.plf) == 0.376
+    assert REBAR["#3"]["plf"] == N3.plf
+    assert REBAR["#20"]["As"] == N20.As
+
+    for name, props in REBAR.items():
+        assert get_rebar(name).As == props["As"]
+        assert get_rebar(name).d_bar == props["d_bar"]
+
+    with pytest.raises(ValueError):
+        get_rebar("#12")
+
+
+def test_calc_phis():
+    """Tests the strength reduction factors for tension controlled sections."""
+    design_code = ACI318()
+    ey = 60 / 29000
+    strains = [0, ey, (ey + 0.005) / 2, 0.005, 0.01]
+    phis = ACI318.calc_phis(tensile_strains=strains)
+
+    assert isinstance(phis, np.ndarray)
+    assert pytest.approx(phis) == [0.65, 0.65, 0.775, 0.9, 0.9]
+    assert ACI318.calc_phis(tensile_strains=strains, as_list=True) == phis.tolist()
+    assert ACI318.calc_phis(tensile_strains=0.01, as_list=True) == [0.9]
+
+    with pytest.raises(NotImplementedError):
+        design_code.calc_phis(tensile_strains=strains, reinf_type="spiral")
+
+    # high yield bar with a yield strain greater than 0.005, no transition region
+    strains = [0, 0.001, 0.004, 0.006]
+    phis = ACI318.calc_phis(tensile_strains=strains, fy=159.5)
+
+    assert pytest.approx(phis) == [0.65, 0.65, 0.65, 0.9]
+
+    # yield strain equal to 0.005
+    phis = ACI318.calc_phis(tensile_strains=strains, fy=145)
+
+    assert pytest.approx(phis) == [0.65, 0.65, 0.65, 0.9]
+
+
+def test_calc_beta_1():
+    """Tests the calculation of beta_1."""
+    code = ACI318()
+
+    assert code.calc_beta_1(fpc=3.0) == pytest.approx(0.85)
+    assert code.calc_beta_1(fpc=4.0) == pytest.approx(0.85)
+    assert code.calc_beta_1(fpc=5.0) == pytest.approx(0.80)
+    assert code.calc_beta_1(fpc=8.0) == pytest.approx(0.65)
+    assert code.calc_beta_1(fpc=10.0) == pytest.approx(0.65)
+
+    with pytest.warns(RuntimeWarning, match="2.5ksi") as record:
+        assert code.calc_beta_1(fpc=2.0) == pytest.approx(0.85)
+
+    assert record[0].filename == __file__
+
+    fpcs = [3.0, 4.0, 5.0, 6.5, 8.0, 10.0]
+    assert code.calc_beta_1_vec(fpc=fpcs) == pytest.approx(
+        [code.calc_beta_1(fpc=fpc) for fpc in fpcs]
+    )
+
+
+def test_create_materials():
+    """Tests the creation of cached ACI 318 materials."""
+    code = ACI318()
+
+    concrete = code.create_concrete_material(fpc=4.0)
+    assert isinstance(concrete, Concrete)
+    assert concrete.ultimate_stress_strain_profile.gamma == pytest.approx(0.85)
+
+    # modifying a returned material does not affect later materials
+    fr = concrete.flexural_tensile_strength
+    concrete.flexural_tensile_strength = 0.0
+    other = code.create_concrete_material(fpc=4.0)
+    assert other is not concrete
+    assert other.flexural_tensile_strength == pytest.approx(fr)
+
+    # modifying the stress-strain profiles does not affect later materials
+    concrete.ultimate_stress_strain_profile.gamma = 0.5
+    concrete.stress_strain_profile.stresses[-1] = -999
+    coloured = code.create_concrete_material(fpc=4.0, colour="red")
+    assert coloured.ultimate_stress_strain_profile.gamma == pytest.approx(0.85)
+    assert coloured.stress_strain_profile.stresses[-1] == pytest.approx(3.4)
+
+    steel = code.create_steel_material(fy=60)
+    assert isinstance(steel, SteelBar)
+    steel.colour = "red"
+    steel.stress_strain_profile.stresses[-1] = 0.0
+    other_steel = ACI318().create_steel_material(fy=60)
+    assert other_steel.colour == "black"
+    assert other_steel.stress_strain_profile.stresses[-1] == pytest.approx(60)
+
+
+def test_concrete_properties():
+    """Tests the tabulated and calculated concrete properties."""
+    code = ACI318()
+
+    # tabulated f'c
+    assert code.calc_concrete_elastic_modulus(fpc=4.0) == pytest.approx(3644.15, 1e-5)
+    assert code.calc_modulus_of_rupture(fpc=4.0) == pytest.approx(0.474342, 1e-5)
+
+    # calculated f'c, wc and lambda_agg
+    assert code.calc_concrete_elastic_modulus(fpc=4.5) == pytest.approx(3865.20, 1e-5)
+    assert code.calc_concrete_elastic_modulus(fpc=4.0, wc=0.11) == pytest.approx(
+        2407.87, 1e-5
+    )
+    assert code.calc_modulus_of_rupture(fpc=4.0, lambda_agg=0.75) == pytest.approx(
+        0.355756, 1e-5
+    )
+
+
+def test_calc_pn():
+    """Tests the calculation of the nominal axial capacity."""
+    code = ACI318()
+
+    p_0 = 0.85 * 4.0 * (16 * 16 - 8 * 0.79) + 60 * 8 * 0.79
+    assert code.calc_Pn(16, 16, 4.0, 8, 0.79) == pytest.approx(0.8 * p_0)
+    assert code.calc_Pn(16, 16, 4.0, 8, 0.79, tie_type="spiral") == pytest.approx(
+        0.85 * p_0
+    )
+
+    assert ACI318.calc_Pn(16, 16, 4.0, 8, 0.79) == pytest.approx(0.8 * p_0)
+
+    with pytest.raises(ValueError):
+        code.calc_Pn(16, 16, 4.0, 8, 0.79, tie_type="hoop")
+
+    pns = code.calc_Pn_batch(
+        b=[12, 16, 24], h=[12, 16, 24], fpc=[4.0, 5.0, 6.0], num_bars=4, bar_area=0.79
+    )
+    assert pns == pytest.approx(
+        [
+            code.calc_Pn(b, b, fpc, 4, 0.79)
+            for b, fpc in zip([12, 16, 24], [4.0, 5.0, 6.0])
+        ]
+    )
+
+
+def test_unusual_inputs_are_silent(capsys):
+    """Tests that unusual inputs warn or raise rather than print."""
+    # warned on every call, despite the cached material, and attributed to the caller
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match="2.5ksi") as record:
+            concrete = ACI318().create_concrete_material(fpc=2.0)
+
+        assert len(record) == 1
+        assert record[0].filename == __file__
+        assert concrete.ultimate_stress_strain_profile.gamma == pytest.approx(0.85)
+
+    with pytest.raises(NotImplementedError):
+        ACI318.calc_phis(tensile_strains=[0.002], reinf_type="spiral")
+
+    assert capsys.readouterr().out == ""
+
+
+def test_create_concrete_material_returns():
+    """Tests that the ACI 318 materials can be used to build a section."""
+    code = ACI318()
+    concrete = code.create_concrete_material(4.0)
+    steel = code.create_steel_material()
+
+    geometry = concrete_rectangular_section(
+        b=16,
+        d=24,
+        dia_top=0.75,
+        area_top=0.44,
+        n_top=2,
+        c_top=1.5,
+        dia_bot=1.0,
+        area_bot=0.79,
+        n_bot=3,
+        c_bot=1.5,
+        n_circle=4,
+        conc_mat=concrete,
+        steel_mat=steel,
+    )
+    code.assign_concrete_section(concrete_section=ConcreteSection(geometry))
+
+    assert code.get_gross_properties().total_area == pytest.approx(16 * 24)
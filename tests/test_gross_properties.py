@@ -2,8 +2,58 @@
 
 import pytest
 import sectionproperties.pre.library.primitive_sections as sp_ps
+from sectionproperties.pre.library.concrete_sections import concrete_rectangular_section
 
 from concreteproperties.analysis_section import AnalysisSection
+from concreteproperties.concrete_section import ConcreteSection
+from concreteproperties.material import Concrete, SteelBar
+from concreteproperties.stress_strain_profile import (
+    ConcreteLinear,
+    RectangularStressBlock,
+    SteelElasticPlastic,
+)
+
+
+concrete = Concrete(
+    name="32 MPa Concrete",
+    density=2.4e-6,
+    stress_strain_profile=ConcreteLinear(elastic_modulus=30.1e3),
+    ultimate_stress_strain_profile=RectangularStressBlock(
+        compressive_strength=32,
+        alpha=0.85,
+        gamma=0.83,
+        ultimate_strain=0.003,
+    ),
+    flexural_tensile_strength=1.0,
+    colour="lightgrey",
+)
+
+steel = SteelBar(
+    name="500 MPa Steel",
+    density=7.85e-6,
+    stress_strain_profile=SteelElasticPlastic(
+        yield_strength=500,
+        elastic_modulus=200e3,
+        fracture_strain=0.05,
+    ),
+    colour="grey",
+)
+
+geometry = concrete_rectangular_section(
+    b=300,
+    d=450,
+    dia_top=16,
+    n_top=2,
+    c_top=40,
+    dia_bot=24,
+    n_bot=3,
+    c_bot=40,
+    n_circle=4,
+    area_top=200,
+    area_bot=450,
+    conc_mat=concrete,
+    steel_mat=steel,
+)
 
 
 def test_rectangle_second_moment_of_area():
@@ -32,6 +82,7 @@ def test_rectangle_second_moment_of_area():
 
     assert pytest.approx(ixx_g) == b * d * d * d / 3
     assert pytest.approx(iyy_g) == d * b * b * b / 3
+    assert pytest.approx(sec.second_moments_of_area()) == (ixx_g, iyy_g, ixy_g)
 
     ixx_c = ixx_g - qx**2 / area
     iyy_c = iyy_g - qy**2 / area
@@ -40,3 +91,60 @@ def test_rectangle_second_moment_of_area():
     assert pytest.approx(ixx_c) == b * d * d * d / 12
     assert pytest.approx(iyy_c) == d * b * b * b / 12
     assert pytest.approx(ixy_c, abs=1e-6) == 0
+
+
+def test_section_creation_is_silent(capsys):
+    """Test that creating a concrete section does not write to the console."""
+    conc_sec = ConcreteSection(geometry)
+    captured = capsys.readouterr()
+
+    assert captured.out == ""
+    assert captured.err == ""
+    assert pytest.approx(conc_sec.gross_properties.total_area) == 300 * 450
+
+
+def test_cpgeom_uses_slots():
+    """Test that the per-bar geometry objects do not carry an instance dict."""
+    conc_sec = ConcreteSection(geometry)
+
+    for geom in conc_sec.all_geometries:
+        assert not hasattr(geom, "__dict__")
+
+
+def test_vectorised_analysis():
+    """Test the vectorised ultimate and service analyses."""
+    rect = sp_ps.rectangular_section(d=500, b=300, material=concrete)
+    sec = AnalysisSection(geometry=rect)
+    kwargs = {
+        "point_na": (0, 250),
+        "d_n": 150,
+        "theta": 0.3,
+        "ultimate_strain": 0.003,
+        "centroid": (150, 250),
+    }
+
+    n_sec, m_x_sec, m_y_sec = sec.ultimate_analysis(**kwargs)
+    n_el, m_x_el, m_y_el = (
+        sum(actions)
+        for actions in zip(
+            *(el.calculate_ultimate_actions(**kwargs) for el in sec.elements)
+        )
+    )
+
+    assert pytest.approx(n_sec) == n_el
+    assert pytest.approx(m_x_sec) == m_x_el
+    assert pytest.approx(m_y_sec) == m_y_el
+
+    # service analysis with the neutral axis at the centroid, n = 0, m_x = E.kappa.I
+    n_sec, m_x_sec, m_y_sec, min_strain, max_strain = sec.service_analysis(
+        ecf=(0, 500),
+        eps0=2.5e-4,
+        theta=0,
+        kappa=1e-6,
+        centroid=(150, 250),
+    )
+
+    assert pytest.approx(n_sec, abs=1e-6) == 0
+    assert pytest.approx(m_x_sec) == 30.1e3 * 1e-6 * 300 * 500**3 / 12
+    assert pytest.approx(m_y_sec, abs=1e-6) == 0
+    assert min_strain < 0 < max_strain
@@ -1,9 +1,14 @@
 """Tests moment interaction diagrams."""
 
+import io
+import pickle
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 from sectionproperties.pre.library.concrete_sections import concrete_rectangular_section
 
+import concreteproperties.concrete_section as cs
 import concreteproperties.results as res
 import concreteproperties.utils as utils
 from concreteproperties.concrete_section import ConcreteSection
@@ -223,6 +228,103 @@ def test_n_spacing():
             )
 
 
+def test_d_n_guess(monkeypatch):
+    """Tests ultimate bending capacity with an initial neutral axis estimate."""
+    ref_res = conc_sec.ultimate_bending_capacity(n=1000e3)
+
+    # close estimate, poor estimate and estimate outside of the section
+    for d_n_guess in [ref_res.d_n * 1.1, 1.0, 10 * D]:
+        ult_res = conc_sec.ultimate_bending_capacity(n=1000e3, d_n_guess=d_n_guess)
+
+        assert pytest.approx(ult_res.n, rel=1e-5) == 1000e3
+        assert pytest.approx(ult_res.d_n, rel=1e-3) == ref_res.d_n
+        assert pytest.approx(ult_res.m_x, rel=1e-4) == ref_res.m_x
+
+    # secant step that stalls away from the root falls back to the bracketed solver
+    def stalled_newton(func, x0, **kwargs):
+        func(x0)
+        func(x0 + 1e-4)
+
+        return x0, SimpleNamespace(converged=True)
+
+    monkeypatch.setattr(cs, "newton", stalled_newton)
+    ult_res = conc_sec.ultimate_bending_capacity(n=1000e3, d_n_guess=1.0)
+
+    assert pytest.approx(ult_res.n, rel=1e-5) == 1000e3
+    assert pytest.approx(ult_res.d_n, rel=1e-3) == ref_res.d_n
+
+
+def test_n_jobs():
+    """Tests generating moment interaction diagrams in parallel."""
+    labels = ["A", "B", "C", "D", "E"]
+
+    for n_spacing in [None, 8]:
+        mi_res = conc_sec.moment_interaction_diagram(
+            labels=labels, n_points=8, n_spacing=n_spacing, progress_bar=False
+        )
+        mi_res_par = conc_sec.moment_interaction_diagram(
+            labels=labels,
+            n_points=8,
+            n_spacing=n_spacing,
+            progress_bar=False,
+            n_jobs=2,
+        )
+
+        assert len(mi_res_par.results) == len(mi_res.results)
+
+        for ult_res, ult_res_par in zip(mi_res.results, mi_res_par.results):
+            assert ult_res_par.label == ult_res.label
+            assert pytest.approx(ult_res_par.n, rel=1e-3) == ult_res.n
+            assert pytest.approx(ult_res_par.m_x, rel=1e-3) == ult_res.m_x
+
+    for n_jobs in [0, -2, 2.5, True]:
+        with pytest.raises(ValueError):
+            conc_sec.moment_interaction_diagram(progress_bar=False, n_jobs=n_jobs)
+
+    # identity checked caches are not sent to the worker processes
+    state = pickle.loads(pickle.dumps(conc_sec)).__dict__
+    assert conc_sec._theta_cache
+    assert state["_theta_cache"].keys() == conc_sec._theta_cache.keys()
+    assert state["_lumped_context"] is None
+    assert not state["_analysis_section_cache"]
+    assert not state["_unique_strains_cache"]
+
+
+def test_show_progress(monkeypatch):
+    """Tests that progress bars are only displayed on an interactive console."""
+    assert not utils.show_progress(progress_bar=False)
+
+    # output redirected
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.setattr("sys.stdout", io.StringIO())
+    assert not utils.show_progress(progress_bar=True)
+
+    # explicit override
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    assert utils.show_progress(progress_bar=True)
+
+    # terminal
+    monkeypatch.delenv("FORCE_COLOR")
+    monkeypatch.setattr(utils.Console, "is_terminal", property(lambda self: True))
+    assert utils.show_progress(progress_bar=True)
+    assert not utils.show_progress(progress_bar=False)
+
+
+def test_results_arrays():
+    """Tests the moment interaction results arrays."""
+    mi_res = conc_sec.moment_interaction_diagram(progress_bar=False)
+
+    for moment in ["m_x", "m_y", "m_xy"]:
+        n_list, m_list = mi_res.get_results_lists(moment=moment)
+        n_arr, m_arr = mi_res.get_results_arrays(moment=moment)
+
+        assert n_arr.tolist() == n_list
+        assert m_arr.tolist() == m_list
+
+    with pytest.raises(ValueError):
+        mi_res.get_results_arrays(moment="m_z")
+
+
 def test_max_comp():
     """Tests maximum compression point."""
     mc = 4000e3  # N.B point chosen to be between first two points on MI diagram
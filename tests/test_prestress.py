@@ -1,5 +1,7 @@
 """Tests for prestressed concrete sections."""
 
+from dataclasses import replace
+
 import pytest
 from sectionproperties.pre.library.primitive_sections import rectangular_section
 
@@ -144,3 +146,26 @@ def test_biaxial_bending():
     """Tests NotImplementedError for biaxial bending diagram."""
     with pytest.raises(NotImplementedError):
         conc_sec.biaxial_bending_diagram()
+
+
+def test_reassigned_strand_material():
+    """Tests that reassigned strand materials are used in the ultimate analysis."""
+    strand_500 = replace(strand, prestress_stress=500)
+
+    def create_section(material: SteelStrand) -> PrestressedSection:
+        geom = rectangular_section(d=800, b=300, material=concrete)
+        geom = add_bar(geometry=geom, area=1000, material=material, x=150, y=80)
+
+        return PrestressedSection(geom)
+
+    sec = create_section(material=strand)
+    m_1000 = sec.ultimate_bending_capacity().m_xy
+
+    # reassign the strand material after the section has been analysed
+    sec.strand_geometries[0].material = strand_500
+    m_500 = sec.ultimate_bending_capacity().m_xy
+
+    assert m_500 != pytest.approx(m_1000)
+    assert m_500 == pytest.approx(
+        create_section(material=strand_500).ultimate_bending_capacity().m_xy
+    )
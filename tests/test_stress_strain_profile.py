@@ -19,6 +19,11 @@ def test_whitney():
     assert pytest.approx(profile.get_stress(0.00069)) == 0.85 * 40
     assert pytest.approx(profile.get_stress(0.001)) == 0.85 * 40
 
+    strains = [0, 0.003, -0.001, 0.00068998, 0.00069]
+    assert pytest.approx(profile.get_stress(strains)) == [
+        profile.get_stress(strain) for strain in strains
+    ]
+
 
 def test_piecewise_linear():
     """Tests the piecewise linear profile."""